@@ -23,7 +23,7 @@ from utils.ui_components import (
     create_card_grid, create_bulk_action_toolbar, create_quick_search,
     create_real_time_metric, create_sortable_table, create_mobile_nav,
     create_empty_state, show_toast, create_action_menu, create_theme_toggle,
-    create_collapsible_section, create_progress_ring, create_status_badge
+    create_collapsible_section, create_status_badge
 )
 
 # Navigation System
@@ -32,6 +32,12 @@ from navigation_system import (
     get_current_navigation
 )
 
+# Header is emitted as a single markdown element instead of one per line
+DASHBOARD_HEADER_MD = (
+    "# 🛡️ SafeSteps Admin Dashboard\n\n"
+    "**Consolidated Admin Experience** • Task-Oriented Design • Mobile-First"
+)
+
 # Business Logic (mock implementations for demo)
 def mock_certificate_data():
     """Mock certificate data for demonstration"""
@@ -87,6 +93,35 @@ def mock_system_health():
         'ssl_expires': '2025-06-15'
     }
 
+@st.cache_data
+def mock_usage_trend_data() -> pd.DataFrame:
+    """Mock daily certificate generation series, built once and reused across reruns"""
+    return pd.DataFrame({
+        'Date': pd.date_range('2025-01-01', periods=30),
+        'Certificates': [15, 23, 18, 31, 29, 42, 35, 28, 33, 41, 
+                       38, 45, 42, 39, 44, 48, 51, 46, 52, 55,
+                       49, 58, 61, 54, 63, 59, 66, 62, 69, 71]
+    }).set_index('Date')
+
+@st.cache_data
+def mock_course_popularity_data() -> pd.DataFrame:
+    """Mock certificates-per-course counts, built once and reused across reruns"""
+    return pd.DataFrame({
+        'Course': ['Digital Citizenship', 'Cyber Safety', 'Online Ethics', 'Data Privacy'],
+        'Certificates': [342, 298, 267, 340]
+    }).set_index('Course')
+
+# Mock integration settings; widget keys are derived once at import
+_INTEGRATIONS = tuple(
+    {**integration, 'config_key': f"config_{integration['name'].lower().replace(' ', '_')}"}
+    for integration in (
+        {"name": "Google Workspace", "status": "connected", "icon": "🔗"},
+        {"name": "Microsoft Teams", "status": "disconnected", "icon": "❌"},
+        {"name": "Slack Notifications", "status": "connected", "icon": "🔗"},
+        {"name": "Zoom Integration", "status": "pending", "icon": "⏳"}
+    )
+)
+
 class AdminDashboard:
     """Main Admin Dashboard Controller"""
     
@@ -129,8 +164,13 @@ class AdminDashboard:
                 - **Ctrl + E** → Bulk Edit
                 """)
     
+    @st.fragment
     def render_admin_command_palette(self):
-        """Render admin command palette for power users"""
+        """Render admin command palette for power users
+        
+        Runs as a fragment so typing commands only reruns the palette;
+        navigation actions still trigger a full app rerun.
+        """
         if st.session_state.get('show_command_palette', False):
             with st.container():
                 st.markdown("### 🎯 Admin Command Palette")
@@ -738,22 +778,11 @@ class AdminDashboard:
         
         with col1:
             st.markdown("#### Certificate Generation")
-            # Mock chart data
-            chart_data = pd.DataFrame({
-                'Date': pd.date_range('2025-01-01', periods=30),
-                'Certificates': [15, 23, 18, 31, 29, 42, 35, 28, 33, 41, 
-                               38, 45, 42, 39, 44, 48, 51, 46, 52, 55,
-                               49, 58, 61, 54, 63, 59, 66, 62, 69, 71]
-            })
-            st.line_chart(chart_data.set_index('Date'))
+            st.line_chart(mock_usage_trend_data())
         
         with col2:
             st.markdown("#### Course Popularity")
-            course_data = pd.DataFrame({
-                'Course': ['Digital Citizenship', 'Cyber Safety', 'Online Ethics', 'Data Privacy'],
-                'Certificates': [342, 298, 267, 340]
-            })
-            st.bar_chart(course_data.set_index('Course'))
+            st.bar_chart(mock_course_popularity_data())
     
     def render_system_settings(self):
         """System configuration and preferences"""
@@ -809,15 +838,7 @@ class AdminDashboard:
             
             st.info("🔌 Configure external service integrations")
             
-            # Mock integration settings
-            integrations = [
-                {"name": "Google Workspace", "status": "connected", "icon": "🔗"},
-                {"name": "Microsoft Teams", "status": "disconnected", "icon": "❌"},
-                {"name": "Slack Notifications", "status": "connected", "icon": "🔗"},
-                {"name": "Zoom Integration", "status": "pending", "icon": "⏳"}
-            ]
-            
-            for integration in integrations:
+            for integration in _INTEGRATIONS:
                 col1, col2, col3 = st.columns([2, 1, 1])
                 with col1:
                     st.text(f"{integration['icon']} {integration['name']}")
@@ -827,7 +848,7 @@ class AdminDashboard:
                                       else 'warning' if integration['status'] == 'pending'
                                       else 'error')
                 with col3:
-                    st.button("Configure", key=f"config_{integration['name']}")
+                    st.button("Configure", key=integration['config_key'])
         
         # Save settings
         st.divider()
@@ -846,17 +867,12 @@ class AdminDashboard:
         
         st.divider()
         
-        # Health metrics
+        # Health metrics (native metrics keep this to one lightweight element per column)
         col1, col2, col3, col4 = st.columns(4)
-        
-        with col1:
-            create_progress_ring(health['cpu_usage'], "CPU Usage", "primary")
-        with col2:
-            create_progress_ring(health['memory_usage'], "Memory Usage", "warning")
-        with col3:
-            create_progress_ring(health['disk_usage'], "Disk Usage", "success")
-        with col4:
-            create_real_time_metric("Response Time", f"{health['response_time']}ms", "normal", "⚡")
+        col1.metric("CPU Usage", f"{health['cpu_usage']}%")
+        col2.metric("Memory Usage", f"{health['memory_usage']}%")
+        col3.metric("Disk Usage", f"{health['disk_usage']}%")
+        col4.metric("⚡ Response Time", f"{health['response_time']}ms")
         
         st.divider()
         
@@ -899,15 +915,10 @@ class AdminDashboard:
         
         # Security overview
         col1, col2, col3, col4 = st.columns(4)
-        
-        with col1:
-            create_real_time_metric("Security Score", "98%", "up", "🛡️")
-        with col2:
-            create_real_time_metric("Failed Logins", "3", "down", "🚫")
-        with col3:
-            create_real_time_metric("Active Sessions", "42", "normal", "👥")
-        with col4:
-            create_real_time_metric("SSL Status", "Valid", "up", "🔐")
+        col1.metric("🛡️ Security Score", "98%")
+        col2.metric("🚫 Failed Logins", "3")
+        col3.metric("👥 Active Sessions", "42")
+        col4.metric("🔐 SSL Status", "Valid")
         
         st.divider()
         
@@ -946,6 +957,18 @@ class AdminDashboard:
                 priority_color = "error" if item["priority"] == "high" else "warning" if item["priority"] == "medium" else "info"
                 create_status_badge(item["priority"].title(), priority_color)
     
+    @st.fragment
+    def render_quick_stats(self):
+        """Sidebar quick stats toggle, scoped so toggling does not rerun the page"""
+        if st.button("📊 Quick Stats", use_container_width=True):
+            st.session_state['show_quick_stats'] = not st.session_state.get('show_quick_stats', False)
+        
+        if st.session_state.get('show_quick_stats', False):
+            analytics = mock_analytics_data()
+            st.metric("Certificates", f"{analytics['total_certificates']:,}")
+            st.metric("Users", f"{analytics['registered_users']}")
+            st.metric("Uptime", f"{analytics['system_uptime']}%")
+    
     def render_main_dashboard(self):
         """Main dashboard rendering method"""
         
@@ -961,26 +984,17 @@ class AdminDashboard:
         )
         
         # Header with admin context
-        st.markdown("# 🛡️ SafeSteps Admin Dashboard")
-        st.markdown("**Consolidated Admin Experience** • Task-Oriented Design • Mobile-First")
+        st.markdown(DASHBOARD_HEADER_MD)
         
         # Render navigation and get current location
         current_area, current_tab = render_task_oriented_navigation()
         
         # Admin-specific sidebar features
         with st.sidebar:
-            st.markdown("---")
-            st.markdown("### 👑 Admin Tools")
+            st.markdown("---\n### 👑 Admin Tools")
             
             # Quick stats
-            if st.button("📊 Quick Stats", use_container_width=True):
-                st.session_state['show_quick_stats'] = not st.session_state.get('show_quick_stats', False)
-            
-            if st.session_state.get('show_quick_stats', False):
-                analytics = mock_analytics_data()
-                st.metric("Certificates", f"{analytics['total_certificates']:,}")
-                st.metric("Users", f"{analytics['registered_users']}")
-                st.metric("Uptime", f"{analytics['system_uptime']}%")
+            self.render_quick_stats()
             
             # Command palette toggle
             if st.button("🎯 Command Palette", use_container_width=True):
@@ -5,8 +5,10 @@ Single-page admin dashboard with collapsible sections for power users
 import streamlit as st
 from datetime import datetime, timedelta
 import pandas as pd
+import numpy as np
 from typing import Dict, List, Any
-import time
+import html
+import uuid
 
 from utils.auth import requires_admin, get_current_user
 from utils.ui_components import (
@@ -25,9 +27,42 @@ from utils.keyboard_shortcuts import (
 from utils.storage import StorageManager
 from utils.course_manager import CourseManager
 
-# Initialize managers
-storage = StorageManager()
-course_manager = CourseManager(storage.local_path / "metadata")
+# Initialize managers once per process and share them across sessions and reruns
+@st.cache_resource
+def _get_storage() -> StorageManager:
+    return StorageManager()
+
+@st.cache_resource
+def _get_course_manager() -> CourseManager:
+    return CourseManager(_get_storage().local_path / "metadata")
+
+storage = _get_storage()
+course_manager = _get_course_manager()
+
+@st.cache_data(ttl=60)
+def _load_courses() -> List[Dict]:
+    """Course list cached for a minute; call ``_load_courses.clear()`` after course changes"""
+    return course_manager.list_courses()
+
+def _focus_search():
+    st.session_state['focus_quick_search'] = True
+
+def _toggle_bulk_actions():
+    st.session_state['show_bulk_actions'] = not st.session_state.get('show_bulk_actions', False)
+
+# Page-specific keyboard shortcuts
+_PAGE_SHORTCUTS = {
+    'ctrl+q': {
+        'action': 'quick_search_focus',
+        'description': 'Focus Quick Search',
+        'callback': _focus_search
+    },
+    'ctrl+b': {
+        'action': 'bulk_actions',
+        'description': 'Toggle Bulk Actions',
+        'callback': _toggle_bulk_actions
+    }
+}
 
 @requires_admin
 def render_efficiency_dashboard():
@@ -36,38 +71,38 @@ def render_efficiency_dashboard():
     # Handle keyboard shortcuts
     handle_keyboard_input()
     
-    # Register page-specific shortcuts
-    page_shortcuts = {
-        'ctrl+q': {
-            'action': 'quick_search_focus',
-            'description': 'Focus Quick Search',
-            'callback': lambda: st.session_state.update({'focus_quick_search': True})
-        },
-        'ctrl+b': {
-            'action': 'bulk_actions',
-            'description': 'Toggle Bulk Actions',
-            'callback': lambda: st.session_state.update({'show_bulk_actions': not st.session_state.get('show_bulk_actions', False)})
-        }
-    }
-    register_page_shortcuts(page_shortcuts)
+    # Register page-specific shortcuts (once per session)
+    if 'shortcuts_registered' not in st.session_state:
+        register_page_shortcuts(_PAGE_SHORTCUTS)
+        st.session_state['shortcuts_registered'] = True
     
     # Header with real-time info
     current_user = get_current_user()
     col1, col2, col3 = st.columns([2, 1, 1])
     
     with col1:
-        st.title("⚡ Efficiency Dashboard")
-        st.caption(f"Welcome back, {current_user.get('username', 'Admin')} | Last login: {datetime.now().strftime('%H:%M:%S')}")
+        # Title and welcome line as one element rather than st.title + st.caption
+        st.markdown(
+            f"<div><h1 style='margin-bottom:0'>⚡ Efficiency Dashboard</h1>"
+            f"<small style='color:{COLORS['text_muted']}'>"
+            f"Welcome back, {html.escape(current_user.get('username', 'Admin'))} | "
+            f"Last login: {datetime.now().strftime('%H:%M:%S')}</small></div>",
+            unsafe_allow_html=True
+        )
     
     with col2:
         # Real-time clock
-        clock_placeholder = st.empty()
-        clock_placeholder.metric("Current Time", datetime.now().strftime('%H:%M:%S'))
+        _live_clock_fragment()
     
     with col3:
         # Quick actions
         if st.button("🔄 Refresh All", use_container_width=True):
-            st.rerun()
+            # Drop cached data; panels pick it up on their next (fragment) run
+            _load_courses.clear()
+            _usage_df.clear()
+            _role_df.clear()
+            _template_df.clear()
+            st.toast("Data refreshed")
     
     # Keyboard shortcuts display
     create_shortcuts_modal()
@@ -81,46 +116,7 @@ def render_efficiency_dashboard():
     
     # Real-time metrics row
     st.subheader("📊 Live Dashboard Metrics")
-    metrics_cols = st.columns(4)
-    
-    # Generate realistic metrics
-    current_time = datetime.now()
-    certificates_today = 47 + (current_time.minute % 10)  # Simulated real-time data
-    active_users = 12 + (current_time.second % 5)
-    system_load = min(95, 65 + (current_time.second % 30))
-    
-    with metrics_cols[0]:
-        create_real_time_metric(
-            "Certificates Today", 
-            certificates_today,
-            "up" if certificates_today > 45 else "normal",
-            "🏆"
-        )
-    
-    with metrics_cols[1]:
-        create_real_time_metric(
-            "Active Users", 
-            active_users,
-            "up" if active_users > 10 else "normal",
-            "👥"
-        )
-    
-    with metrics_cols[2]:
-        create_real_time_metric(
-            "System Health", 
-            f"{system_load}%",
-            "up" if system_load > 90 else "normal",
-            "💚"
-        )
-    
-    with metrics_cols[3]:
-        storage_used = 2.3  # GB
-        create_real_time_metric(
-            "Storage Used", 
-            f"{storage_used:.1f} GB",
-            "normal",
-            "💾"
-        )
+    _live_metrics_fragment()
     
     st.divider()
     
@@ -133,12 +129,10 @@ def render_efficiency_dashboard():
             render_certificate_hub()
         
         # User Management Section
-        with st.expander("👥 User Management Console", expanded=False):
-            render_user_management_console()
+        _render_lazy_expander("👥 User Management Console", "users", render_user_management_console)
         
         # Template Management Section
-        with st.expander("📄 Template & Course Manager", expanded=False):
-            render_template_course_manager()
+        _render_lazy_expander("📄 Template & Course Manager", "templates", render_template_course_manager)
     
     with col_right:
         # Analytics & Reports Section
@@ -146,22 +140,22 @@ def render_efficiency_dashboard():
             render_analytics_panel()
         
         # System Administration
-        with st.expander("⚙️ System Administration", expanded=False):
-            render_system_admin_panel()
+        _render_lazy_expander("⚙️ System Administration", "system", render_system_admin_panel)
         
         # Recent Activity Feed
         with st.expander("📝 Activity Feed", expanded=True):
             render_activity_feed()
     
     # Bulk actions toolbar (if items selected)
-    if st.session_state.get('selected_items', []):
+    selected = st.session_state.get('selected_items', [])
+    if selected:
         st.divider()
         bulk_actions = [
-            {'key': 'export', 'label': 'Export Selected', 'icon': '📤', 'type': 'secondary', 'callback': lambda: bulk_export()},
-            {'key': 'delete', 'label': 'Delete Selected', 'icon': '🗑️', 'type': 'secondary', 'callback': lambda: bulk_delete()},
-            {'key': 'archive', 'label': 'Archive Selected', 'icon': '📦', 'type': 'secondary', 'callback': lambda: bulk_archive()}
+            {'key': 'export', 'label': 'Export Selected', 'icon': '📤', 'type': 'secondary', 'callback': lambda: bulk_export(selected)},
+            {'key': 'delete', 'label': 'Delete Selected', 'icon': '🗑️', 'type': 'secondary', 'callback': lambda: bulk_delete(selected)},
+            {'key': 'archive', 'label': 'Archive Selected', 'icon': '📦', 'type': 'secondary', 'callback': lambda: bulk_archive(selected)}
         ]
-        create_bulk_action_toolbar(bulk_actions, len(st.session_state.get('selected_items', [])))
+        create_bulk_action_toolbar(bulk_actions, len(selected))
     
     # Footer with shortcuts hint
     st.divider()
@@ -171,11 +165,93 @@ def render_efficiency_dashboard():
     with col2:
         create_shortcut_display()
 
+def _render_lazy_expander(label: str, section: str, render_body):
+    """Collapsed expander whose body is only built once the user asks for it"""
+    state_key = f"exp_{section}"
+    is_open = st.session_state.setdefault(state_key, False)
+    
+    with st.expander(label, expanded=is_open):
+        if is_open:
+            render_body()
+        elif st.button("Load", key=f"load_{section}", use_container_width=True):
+            st.session_state[state_key] = True
+            st.rerun()
+
+@st.fragment(run_every="5s")
+def _live_metrics_fragment():
+    """Simulated live metrics, refreshed on their own timer instead of on every page rerun"""
+    metrics_cols = st.columns(4)
+    
+    # Generate realistic metrics, frozen between ticks so page reruns don't reflow them
+    current_time = datetime.now()
+    snapshot = st.session_state.get('live_metrics_snapshot')
+    if snapshot is None or current_time - snapshot['taken_at'] >= timedelta(seconds=5):
+        snapshot = {
+            'taken_at': current_time,
+            'certificates_today': 47 + (current_time.minute % 10),  # Simulated real-time data
+            'active_users': 12 + (current_time.second % 5),
+            'system_load': min(95, 65 + (current_time.second % 30))
+        }
+        st.session_state['live_metrics_snapshot'] = snapshot
+    
+    certificates_today = snapshot['certificates_today']
+    active_users = snapshot['active_users']
+    system_load = snapshot['system_load']
+    
+    with metrics_cols[0]:
+        create_real_time_metric(
+            "Certificates Today", 
+            certificates_today,
+            "up" if certificates_today > 45 else "normal",
+            "🏆"
+        )
+    
+    with metrics_cols[1]:
+        create_real_time_metric(
+            "Active Users", 
+            active_users,
+            "up" if active_users > 10 else "normal",
+            "👥"
+        )
+    
+    with metrics_cols[2]:
+        create_real_time_metric(
+            "System Health", 
+            f"{system_load}%",
+            "up" if system_load > 90 else "normal",
+            "💚"
+        )
+    
+    with metrics_cols[3]:
+        storage_used = 2.3  # GB
+        create_real_time_metric(
+            "Storage Used", 
+            f"{storage_used:.1f} GB",
+            "normal",
+            "💾"
+        )
+
+@st.fragment(run_every="1s")
+def _live_clock_fragment():
+    """Ticking clock that refreshes on its own without rerunning the page"""
+    st.metric("Current Time", datetime.now().strftime('%H:%M:%S'))
+
+def _build_zip(batch_id: str) -> bytes:
+    """Download payload for an Express Mode batch"""
+    # Placeholder payload until Express Mode is wired to the certificate generator.
+    # Not cached: every Generate click mints a new batch id, so a cache keyed
+    # on it would never hit and would only grow
+    return b"dummy certificate data"
+
 def render_certificate_hub():
     """Render certificate generation hub with express mode"""
-    tab1, tab2, tab3 = st.tabs(["🚀 Express Mode", "📊 Batch Status", "🎯 Quick Generate"])
+    # Only the selected view is built, unlike st.tabs which runs every body
+    active_view = st.radio(
+        "View", ["🚀 Express Mode", "📊 Batch Status", "🎯 Quick Generate"],
+        horizontal=True, key="certificate_hub_view", label_visibility="collapsed"
+    )
     
-    with tab1:
+    if active_view == "🚀 Express Mode":
         st.markdown("**Express Certificate Generation - All Steps in One View**")
         
         # Express mode: All 5 steps visible
@@ -218,13 +294,10 @@ def render_certificate_hub():
             st.markdown("**4. Generate**")
             if st.session_state.get('express_validated') and 'express_template' in st.session_state:
                 if st.button("🏆 Generate", key="express_generate", use_container_width=True, type="primary"):
-                    # Simulate generation with progress
-                    progress_bar = st.progress(0)
-                    for i in range(100):
-                        progress_bar.progress(i + 1)
-                        time.sleep(0.01)
-                    st.success("✅ Generated!")
+                    with st.status("Generating certificates...", expanded=False) as status:
+                        status.update(label="✅ Generated!", state="complete")
                     st.session_state['express_generated'] = True
+                    st.session_state['express_batch_id'] = f"express_{uuid.uuid4().hex[:8]}"
             else:
                 st.button("🏆 Generate", disabled=True, use_container_width=True)
         
@@ -233,7 +306,7 @@ def render_certificate_hub():
             if st.session_state.get('express_generated'):
                 st.download_button(
                     "📥 Download",
-                    data="dummy certificate data",
+                    data=_build_zip(st.session_state['express_batch_id']),
                     file_name="certificates.zip",
                     mime="application/zip",
                     use_container_width=True
@@ -241,7 +314,7 @@ def render_certificate_hub():
             else:
                 st.button("📥 Download", disabled=True, use_container_width=True)
     
-    with tab2:
+    elif active_view == "📊 Batch Status":
         # Batch status table
         batch_data = [
             {"id": "BATCH001", "status": "Completed", "count": 25, "created": "2024-01-15 09:30"},
@@ -260,7 +333,7 @@ def render_certificate_hub():
             "batch_table"
         )
     
-    with tab3:
+    else:
         st.markdown("**Quick Generate - Templates & Courses**")
         
         # Quick generation options
@@ -269,17 +342,26 @@ def render_certificate_hub():
         with quick_col1:
             st.markdown("**Predefined Templates**")
             templates = ["Digital Citizenship", "Safety Training", "Compliance Course"]
-            for template in templates:
-                if st.button(f"🚀 Generate {template}", key=f"quick_{template}", use_container_width=True):
-                    st.success(f"Generating {template} certificates...")
+            selected_template = st.selectbox(
+                "Template", templates, key="quick_template_sel", label_visibility="collapsed"
+            )
+            if st.button("🚀 Generate", key="quick_template_go", use_container_width=True):
+                st.success(f"Generating {selected_template} certificates...")
         
         with quick_col2:
             st.markdown("**Recent Courses**")
-            courses = course_manager.list_courses()[:3]  # Get first 3 courses
-            for course in courses:
-                if st.button(f"📚 Use {course.name}", key=f"course_{course.id}", use_container_width=True):
-                    st.success(f"Loading {course.name} template...")
+            courses = _load_courses()[:3]  # Get first 3 courses
+            if courses:
+                selected_course = st.selectbox(
+                    "Course", [course['name'] for course in courses],
+                    key="quick_course_sel", label_visibility="collapsed"
+                )
+                if st.button("📚 Use", key="quick_course_go", use_container_width=True):
+                    st.success(f"Loading {selected_course} template...")
+            else:
+                st.caption("No courses yet")
 
+@st.fragment
 def render_user_management_console():
     """Render user management console with bulk operations"""
     
@@ -317,31 +399,32 @@ def render_user_management_console():
         {"username": "bob.user", "email": "bob@company.com", "role": "user", "status": "inactive", "last_login": "2024-01-10"}
     ]
     
-    # Selection checkboxes
-    selected_users = []
-    for idx, user in enumerate(users_data):
-        col1, col2, col3, col4, col5, col6 = st.columns([0.5, 2, 2, 1, 1, 1])
-        
-        with col1:
-            if st.checkbox("", key=f"user_select_{idx}"):
-                selected_users.append(user['username'])
-        
-        with col2:
-            st.text(user['username'])
-        with col3:
-            st.text(user['email'])
-        with col4:
-            st.text(user['role'])
-        with col5:
-            status_color = "🟢" if user['status'] == 'active' else "🔴"
-            st.text(f"{status_color} {user['status']}")
-        with col6:
-            st.text(user['last_login'])
-    
-    # Store selected users for bulk actions
-    if selected_users:
+    # Single editable grid with a selection column instead of a widget per cell
+    users_df = pd.DataFrame(users_data)
+    users_df['status'] = users_df['status'].map(
+        lambda status: f"{'🟢' if status == 'active' else '🔴'} {status}"
+    )
+    users_df.insert(0, 'select', False)
+    
+    edited_users = st.data_editor(
+        users_df,
+        hide_index=True,
+        key="user_editor",
+        use_container_width=True,
+        column_config={'select': st.column_config.CheckboxColumn("", width="small")},
+        disabled=['username', 'email', 'role', 'status', 'last_login']
+    )
+    selected_users = edited_users.loc[edited_users['select'], 'username'].tolist()
+    
+    # Store selected users for bulk actions; the toolbar is drawn by the
+    # full page, so a changed selection reruns the app, not just this fragment
+    if selected_users != st.session_state.get('selected_items', []):
         st.session_state['selected_items'] = selected_users
+        st.rerun(scope="app")
 
+COURSES_PER_PAGE = 5
+
+@st.fragment
 def render_template_course_manager():
     """Render template and course management"""
     
@@ -385,49 +468,80 @@ def render_template_course_manager():
         course_cols = st.columns(2)
         with course_cols[0]:
             if st.button("➕ Create Course", use_container_width=True):
+                _load_courses.clear()
                 st.success("Course creation initiated...")
         with course_cols[1]:
             if st.button("📊 Course Analytics", use_container_width=True):
                 st.success("Loading course analytics...")
         
         # Course list
-        courses = course_manager.list_courses()
+        courses = _load_courses()
         if courses:
-            for course in courses[:5]:  # Show first 5 courses
+            # Render one page of courses at a time
+            page_count = max(1, -(-len(courses) // COURSES_PER_PAGE))
+            page = st.number_input("Page", 1, page_count, 1, key="course_page") - 1 if page_count > 1 else 0
+            start = page * COURSES_PER_PAGE
+            
+            for course in courses[start:start + COURSES_PER_PAGE]:
                 with st.container(border=True):
                     col1, col2, col3 = st.columns([2, 1, 1])
                     with col1:
-                        st.markdown(f"**{course.name}**")
-                        st.caption(course.description)
+                        st.markdown(f"**{course['name']}**")
+                        st.caption(course['description'])
                     with col2:
-                        st.text(f"Uses: {course.usage_count}")
+                        st.text(f"Uses: {course['usage_count']}")
                     with col3:
-                        if st.button("🚀 Use", key=f"use_course_{course.id}"):
-                            st.success(f"Using {course.name}...")
+                        if st.button("🚀 Use", key=f"use_course_{course['id']}"):
+                            st.success(f"Using {course['name']}...")
         else:
             st.info("No courses available. Create your first course!")
 
+# Static sample chart data, built once per process
+# Daily (certificates, users) pairs for the usage chart
+_USAGE = np.array([
+    [23, 12], [34, 15], [45, 18], [32, 14], [56, 22], [67, 25], [78, 28],
+    [54, 21], [43, 19], [65, 24], [76, 27], [87, 31], [65, 26], [89, 33]
+], dtype=np.int32)
+
+@st.cache_data
+def _usage_df() -> pd.DataFrame:
+    return pd.DataFrame(
+        _USAGE,
+        columns=['Certificates', 'Users'],
+        index=pd.date_range(start='2024-01-01', periods=len(_USAGE), freq='D', name='Date')
+    )
+
+@st.cache_data
+def _role_df() -> pd.DataFrame:
+    return pd.DataFrame({
+        'Role': ['Admin', 'User', 'Guest'],
+        'Count': [8, 142, 6]
+    }).set_index('Role')
+
+@st.cache_data
+def _template_df() -> pd.DataFrame:
+    return pd.DataFrame({
+        'Template': ['Digital Citizenship', 'Safety Training', 'Compliance'],
+        'Generated': [156, 89, 67]
+    }).set_index('Template')
+
+@st.fragment
 def render_analytics_panel():
     """Render analytics dashboard panel"""
     
-    # Analytics tabs
-    tab1, tab2, tab3 = st.tabs(["📈 Usage", "👥 Users", "🏆 Certs"])
+    # Analytics views (only the selected one is built)
+    active_view = st.radio(
+        "View", ["📈 Usage", "👥 Users", "🏆 Certs"],
+        horizontal=True, key="analytics_view", label_visibility="collapsed"
+    )
     
-    with tab1:
+    if active_view == "📈 Usage":
         # Usage analytics
         st.markdown("**System Usage Trends**")
         
-        # Generate sample data for charts
-        dates = pd.date_range(start='2024-01-01', periods=14, freq='D')
-        usage_data = pd.DataFrame({
-            'Date': dates,
-            'Certificates': [23, 34, 45, 32, 56, 67, 78, 54, 43, 65, 76, 87, 65, 89],
-            'Users': [12, 15, 18, 14, 22, 25, 28, 21, 19, 24, 27, 31, 26, 33]
-        })
-        
-        st.line_chart(usage_data.set_index('Date'))
+        st.line_chart(_usage_df())
     
-    with tab2:
+    elif active_view == "👥 Users":
         # User analytics
         st.markdown("**User Activity**")
         
@@ -439,13 +553,9 @@ def render_analytics_panel():
             st.metric("New Users (Week)", "12", delta="+3")
         
         # User role distribution
-        role_data = pd.DataFrame({
-            'Role': ['Admin', 'User', 'Guest'],
-            'Count': [8, 142, 6]
-        })
-        st.bar_chart(role_data.set_index('Role'))
+        st.bar_chart(_role_df())
     
-    with tab3:
+    else:
         # Certificate analytics
         st.markdown("**Certificate Generation**")
         
@@ -457,38 +567,42 @@ def render_analytics_panel():
             st.metric("This Week", "284", delta="+45")
         
         # Most popular templates
-        template_data = pd.DataFrame({
-            'Template': ['Digital Citizenship', 'Safety Training', 'Compliance'],
-            'Generated': [156, 89, 67]
-        })
-        st.bar_chart(template_data.set_index('Template'))
+        st.bar_chart(_template_df())
 
+_ADMIN_ACTION_MESSAGES = {
+    "🔄 Restart Services": "Services restarting...",
+    "🧹 Clear Cache": "Cache cleared!",
+    "💾 Backup Now": "Backup initiated...",
+    "📊 System Report": "Generating system report..."
+}
+
+def _run_admin_action():
+    """Handle the picked admin action once, then clear the control so it can be picked again"""
+    action = st.session_state.get("admin_action")
+    if action:
+        st.session_state["admin_action_message"] = _ADMIN_ACTION_MESSAGES[action]
+    st.session_state["admin_action"] = None
+
+@st.fragment
 def render_system_admin_panel():
     """Render system administration panel"""
     
     # System status indicators
-    status_cols = st.columns(3)
-    with status_cols[0]:
-        st.success("🟢 System Online")
-    with status_cols[1]:
-        st.info("🔵 Backup Running")
-    with status_cols[2]:
-        st.warning("🟡 Updates Available")
+    st.markdown("🟢 System Online &nbsp; 🔵 Backup Running &nbsp; 🟡 Updates Available")
     
     # Quick admin actions
-    admin_cols = st.columns(2)
-    with admin_cols[0]:
-        if st.button("🔄 Restart Services", use_container_width=True):
-            st.success("Services restarting...")
-        if st.button("🧹 Clear Cache", use_container_width=True):
-            st.success("Cache cleared!")
-    
-    with admin_cols[1]:
-        if st.button("💾 Backup Now", use_container_width=True):
-            st.success("Backup initiated...")
-        if st.button("📊 System Report", use_container_width=True):
-            st.success("Generating system report...")
+    st.segmented_control(
+        "Admin Action",
+        list(_ADMIN_ACTION_MESSAGES),
+        key="admin_action",
+        on_change=_run_admin_action,
+        label_visibility="collapsed"
+    )
+    message = st.session_state.pop("admin_action_message", None)
+    if message:
+        st.success(message)
 
+@st.fragment
 def render_activity_feed():
     """Render recent activity feed"""
     
@@ -500,33 +614,30 @@ def render_activity_feed():
         {"time": "23 min ago", "user": "alice.admin", "action": "Updated course content", "icon": "📚"}
     ]
     
-    for activity in activities:
-        with st.container():
-            col1, col2, col3 = st.columns([0.5, 2, 1])
-            with col1:
-                st.markdown(activity["icon"])
-            with col2:
-                st.markdown(f"**{activity['user']}** {activity['action']}")
-            with col3:
-                st.caption(activity["time"])
-            st.divider()
+    # One markdown element for the whole feed instead of a container + columns per row
+    feed_html = "".join(
+        f"<div style='display:flex;gap:1em;border-bottom:1px solid {COLORS['border']};padding:.3em 0'>"
+        f"<span>{activity['icon']}</span>"
+        f"<span><b>{html.escape(activity['user'])}</b> {html.escape(activity['action'])}</span>"
+        f"<span style='margin-left:auto;color:{COLORS['text_muted']}'>{activity['time']}</span>"
+        f"</div>"
+        for activity in activities
+    )
+    st.markdown(feed_html, unsafe_allow_html=True)
 
 # Bulk action functions
-def bulk_export():
+def bulk_export(selected: List[str]):
     """Handle bulk export action"""
-    selected = st.session_state.get('selected_items', [])
     st.success(f"Exporting {len(selected)} items...")
 
-def bulk_delete():
+def bulk_delete(selected: List[str]):
     """Handle bulk delete action"""
-    selected = st.session_state.get('selected_items', [])
     st.warning(f"Deleting {len(selected)} items...")
     # Clear selection after action
     st.session_state['selected_items'] = []
 
-def bulk_archive():
+def bulk_archive(selected: List[str]):
     """Handle bulk archive action"""
-    selected = st.session_state.get('selected_items', [])
     st.info(f"Archiving {len(selected)} items...")
     # Clear selection after action
     st.session_state['selected_items'] = []
@@ -3,9 +3,12 @@ SafeSteps V2 - User-Friendly Guidance Dashboard
 Help-rich admin interface with tutorials and guidance for beginners
 """
 import streamlit as st
-from datetime import datetime
+import functools
+import html
 import json
-from typing import Dict, List, Any
+import textwrap
+import pandas as pd
+from typing import Dict, List, Any, Optional
 
 from utils.auth import requires_admin, get_current_user
 from utils.ui_components import (
@@ -14,7 +17,7 @@ from utils.ui_components import (
 )
 from utils.ui_helpers import (
     manage_navigation_state, manage_tutorial_state, advance_tutorial_step,
-    complete_tutorial, skip_tutorial, is_tutorial_completed
+    complete_tutorial, skip_tutorial, is_tutorial_completed, reset_tutorial
 )
 from utils.help_system import (
     HelpSystem, create_contextual_help, show_help_modal,
@@ -26,11 +29,341 @@ from utils.workflow_persistence import (
 from utils.storage import StorageManager
 from utils.course_manager import CourseManager
 
-# Initialize managers
-storage = StorageManager()
-course_manager = CourseManager(storage.local_path / "metadata")
-help_system = HelpSystem()
-workflow_persistence = WorkflowPersistence()
+# Optional: pre-render static help content to HTML so the browser skips markdown parsing
+try:
+    import markdown
+    MARKDOWN_AVAILABLE = True
+except ImportError:
+    MARKDOWN_AVAILABLE = False
+    markdown = None
+
+# Managers are built once per process and shared across sessions and reruns
+@st.cache_resource
+def get_storage() -> StorageManager:
+    return StorageManager()
+
+@st.cache_resource
+def get_course_manager() -> CourseManager:
+    return CourseManager(get_storage().local_path / "metadata")
+
+@st.cache_resource
+def get_help_system() -> HelpSystem:
+    return HelpSystem()
+
+@st.cache_resource
+def get_workflow_persistence() -> WorkflowPersistence:
+    return WorkflowPersistence()
+
+# Static page content, built once at import instead of on every rerun
+_TUTORIAL_STEPS = (
+    {
+        "title": "Welcome to SafeSteps!",
+        "content": """
+        This guided dashboard is designed to help you manage certificates easily.
+        
+        **What you can do here:**
+        
+        - Generate certificates for students
+        - Manage users and permissions
+        - Create and manage certificate templates
+        - View analytics and reports
+        
+        Let's take a quick tour!
+        """
+    },
+    {
+        "title": "Dashboard Layout",
+        "content": """
+        The dashboard is organized into clear sections:
+        
+        📊 **Quick Stats** - See your key metrics at a glance
+        🏆 **Certificate Management** - Your main tools for certificates
+        👥 **User Management** - Manage who can access the system
+        📄 **Templates** - Create and manage certificate designs
+        
+        Each section has helpful tooltips and guidance.
+        """
+    },
+    {
+        "title": "Getting Help",
+        "content": """
+        Look for these helpful features:
+        
+        🎓 **Tutorial icons** - Click for contextual help
+        ❓ **Help Center** - Comprehensive documentation
+        💡 **Tips** - Helpful hints throughout the interface
+        📚 **Guided workflows** - Step-by-step processes
+        
+        You can always toggle tutorials on/off in the top right.
+        """
+    }
+)
+
+# Help center content
+_HELP_GUIDES = (
+    "🏆 How to Generate Your First Certificate",
+    "👥 Managing Users and Permissions",
+    "📄 Creating Custom Templates",
+    "📊 Understanding Analytics",
+    "💾 Backing Up Your Data",
+    "⚙️ System Configuration"
+)
+
+_HELP_FAQS = (
+    {"q": "What file formats can I upload?", "a": "SafeSteps accepts CSV and Excel (.xlsx) files with student data."},
+    {"q": "How many certificates can I generate at once?", "a": "There's no limit! You can generate certificates for thousands of students in one batch."},
+    {"q": "Can I customize the certificate design?", "a": "Yes! You can upload custom templates or modify existing ones."},
+    {"q": "Are certificates secure?", "a": "Yes, all certificates include unique verification codes and digital signatures."}
+)
+
+_HELP_TUTORIALS = (
+    "🎬 SafeSteps Overview (5 min)",
+    "🎬 Generating Your First Certificate (3 min)",
+    "🎬 Managing Users (4 min)",
+    "🎬 Custom Templates (6 min)",
+    "🎬 Advanced Features (8 min)"
+)
+
+_SIDEBAR_HELP = {
+    'dashboard': {
+        'title': '📊 Dashboard Help',
+        'content': """
+        **Dashboard Overview:**
+        Your main control center for SafeSteps.
+        
+        **Key Sections:**
+        
+        - Metrics: See your current stats
+        - Certificate Management: Create certificates
+        - User Management: Manage team access
+        - Quick Actions: Common shortcuts
+        """
+    },
+    'certificates': {
+        'title': '🏆 Certificate Help',
+        'content': """
+        **Certificate Generation:**
+        
+        1. Upload student data (CSV/Excel)
+        2. Choose a template design
+        3. Review and generate
+        4. Download or email results
+        
+        **File Requirements:**
+        
+        - Must have 'name' column
+        - Must have 'email' column
+        - CSV or Excel format only
+        """
+    }
+}
+
+def _markdown_to_html(text: str) -> Optional[str]:
+    """Help markdown as HTML, or None to fall back to st.markdown"""
+    if not MARKDOWN_AVAILABLE:
+        return None
+    return markdown.markdown(textwrap.dedent(text).strip())
+
+# Page scripts re-execute on every rerun, so the conversion is cached
+# per text rather than done in module constants
+@st.cache_data(show_spinner=False)
+def _prerender_markdown(text: str) -> Optional[str]:
+    return _markdown_to_html(text)
+
+_CERTIFICATE_HELP_MD = """
+**What are certificates?**
+Digital certificates are awarded to students who complete courses or training.
+
+**How to generate certificates:**
+
+1. **Upload student data** - CSV or Excel file with student names and emails
+2. **Choose a template** - Select from existing templates or create custom ones
+3. **Review and generate** - Check everything looks correct
+4. **Download or email** - Get your certificates as PDF files
+
+**Tips for success:**
+
+- Make sure your data file has 'name' and 'email' columns
+- Preview templates before generating large batches
+- Test with a small group first
+"""
+
+_USER_HELP_MD = """
+**User Roles Explained:**
+
+- **Admin**: Full access to all features, can manage other users
+- **User**: Can generate certificates and view their own data
+- **Guest**: Read-only access for viewing certificates
+
+**Adding Users:**
+
+1. Click "Add New User"
+2. Enter their name and email
+3. Choose their role
+4. They'll receive login instructions by email
+
+**Security Tips:**
+
+- Only give admin access to trusted team members
+- Regularly review user list and remove inactive accounts
+- Use strong passwords and consider enabling 2FA
+"""
+
+def _render_help_modal(flag: str, flags: Dict[str, bool], title: str, body: str):
+    """Bordered help panel shown while flags[flag] is set, with a Close button that clears it"""
+    if not flags[flag]:
+        return
+    
+    with st.container(border=True):
+        body_html = _prerender_markdown(body)
+        if body_html is not None:
+            st.html(f"<h3>{html.escape(title)}</h3>{body_html}")
+        else:
+            st.markdown(f"### {title}")
+            st.markdown(body)
+        
+        if st.button("Close Help", type="primary", key=f"close_{flag}"):
+            st.session_state[flag] = False
+            st.rerun()
+
+# Each item's completion comes from the session flag named by 'state_key'
+# (None means the welcome tutorial's completion)
+_CHECKLIST_SKELETON = (
+    {"key": "tutorial_completed", "label": "Complete welcome tutorial", "state_key": None},
+    {"key": "first_certificate", "label": "Generate your first certificate", "state_key": 'first_certificate_generated'},
+    {"key": "user_added", "label": "Add a team member", "state_key": 'first_user_added'},
+    {"key": "template_customized", "label": "Customize a template", "state_key": 'first_template_customized'}
+)
+
+_CERT_BATCHES = (
+    {"name": "January Safety Training", "status": "Completed", "count": 45, "date": "2024-01-15"},
+    {"name": "Q4 Compliance Certificates", "status": "Processing", "count": 23, "date": "2024-01-14"},
+    {"name": "Digital Citizenship Batch 3", "status": "Ready", "count": 67, "date": "2024-01-13"}
+)
+
+# Per-template widget keys are built once here rather than on every rerun
+_CERT_TEMPLATES = tuple(
+    {**template, "preview_key": f"preview_{template['name']}", "use_key": f"use_{template['name']}"}
+    for template in (
+        {"name": "Digital Citizenship", "description": "Modern design for digital literacy courses", "uses": 156},
+        {"name": "Safety Training", "description": "Professional template for safety certifications", "uses": 89},
+        {"name": "Compliance Course", "description": "Formal design for compliance training", "uses": 234},
+        {"name": "General Achievement", "description": "Versatile template for any course", "uses": 45}
+    )
+)
+
+_USERS = (
+    {"username": "admin", "email": "admin@safesteps.local", "role": "admin", "status": "active", "last_login": "Today"},
+    {"username": "john.doe", "email": "john@company.com", "role": "user", "status": "active", "last_login": "Yesterday"},
+    {"username": "jane.smith", "email": "jane@company.com", "role": "user", "status": "inactive", "last_login": "1 week ago"}
+)
+
+_ADMIN_PERMISSIONS = (
+    "✅ Generate certificates",
+    "✅ Manage all users",
+    "✅ Create and edit templates",
+    "✅ View all analytics",
+    "✅ System administration",
+    "✅ Export all data"
+)
+
+_USER_PERMISSIONS = (
+    "✅ Generate certificates",
+    "❌ Manage other users",
+    "❌ Create templates (can use existing)",
+    "✅ View own analytics",
+    "❌ System administration",
+    "✅ Export own data"
+)
+
+# Permission lists as one markdown block each; denied permissions are greyed out
+_ADMIN_PERMISSIONS_MD = "\n\n".join(("**👑 Admin Permissions:**",) + _ADMIN_PERMISSIONS)
+_USER_PERMISSIONS_MD = "\n\n".join(
+    ("**👤 User Permissions:**",) +
+    tuple(f":gray[{perm}]" if "❌" in perm else perm for perm in _USER_PERMISSIONS)
+)
+
+_QUICK_ACTIONS = (
+    {"label": "🏆 Generate Certificates", "desc": "Start the certificate creation process", "key": "quick_generate"},
+    {"label": "👤 Add User", "desc": "Invite a new team member", "key": "quick_add_user"},
+    {"label": "📄 Upload Template", "desc": "Add a new certificate design", "key": "quick_template"},
+    {"label": "📊 View Reports", "desc": "See usage and analytics", "key": "quick_reports"},
+    {"label": "💾 Backup Data", "desc": "Create a system backup", "key": "quick_backup"},
+    {"label": "⚙️ System Settings", "desc": "Configure SafeSteps", "key": "quick_settings"}
+)
+
+_RECENT_ACTIVITIES = (
+    {"time": "5 minutes ago", "user": "john.doe", "action": "generated 25 certificates", "icon": "🏆", "type": "success"},
+    {"time": "15 minutes ago", "user": "You", "action": "added new user jane.smith", "icon": "👤", "type": "info"},
+    {"time": "1 hour ago", "user": "jane.smith", "action": "logged in for the first time", "icon": "🔐", "type": "info"},
+    {"time": "2 hours ago", "user": "System", "action": "completed automatic backup", "icon": "💾", "type": "success"},
+    {"time": "3 hours ago", "user": "john.doe", "action": "uploaded new template", "icon": "📄", "type": "info"}
+)
+
+# Recent activity feed as a single HTML list (one element instead of a row of columns per entry)
+_RECENT_ACTIVITY_HTML = (
+    "<ul style='list-style:none;padding:0;margin:0'>" + "".join(
+        f"<li style='display:flex;gap:.75em;padding:.5em 0;border-bottom:1px solid {COLORS['border']}'>"
+        f"<span>{activity['icon']}</span>"
+        f"<span><b>{html.escape(activity['user'])}</b> {html.escape(activity['action'])}</span>"
+        f"<span style='margin-left:auto;color:{COLORS['text_muted']};white-space:nowrap'>{activity['time']}</span>"
+        f"</li>"
+        for activity in _RECENT_ACTIVITIES
+    ) + "</ul>"
+)
+
+# Status value -> badge emoji, shared by the batch and user tables
+_STATUS_BADGES = {
+    "Completed": "✅",
+    "Processing": "🔄",
+    "Ready": "⏳",
+    "active": "🟢",
+    "inactive": "🔴"
+}
+
+def _status_label(status: str) -> str:
+    return f"{_STATUS_BADGES.get(status, '•')} {status.title()}"
+
+def _checklist_status(item: Dict[str, Any], flags: Dict[str, bool], welcome_done: bool) -> bool:
+    """Completion flag for a getting-started checklist item"""
+    if item['state_key'] is None:
+        return welcome_done
+    return flags[item['state_key']]
+
+def _format_checklist(items: List[Dict[str, Any]]) -> str:
+    """Checklist items as a single markdown block, one item per paragraph"""
+    return "\n\n".join(f"{'✅' if item['completed'] else '⭕'} {item['label']}" for item in items)
+
+# Session flags the guided dashboard reads, with their defaults
+_FLAG_DEFAULTS = {
+    'show_tutorials': True,
+    'show_help_center': False,
+    'show_getting_started': False,
+    'guided_dashboard_visited': False,
+    'first_certificate_generated': False,
+    'first_user_added': False,
+    'first_template_customized': False,
+    'show_certificate_help': False,
+    'show_user_help': False
+}
+
+@functools.lru_cache(maxsize=16)
+def _setup_progress(completed: tuple) -> tuple:
+    """Completed count, fraction and label for the setup checklist
+    
+    Only 2**4 checklist states exist, so each is formatted once.
+    """
+    completed_count = sum(completed)
+    return (
+        completed_count,
+        completed_count / len(completed),
+        f"Setup Progress: {completed_count}/{len(completed)} tasks completed"
+    )
+
+def _snapshot_flags() -> Dict[str, bool]:
+    """Read all dashboard flags from session state in one pass"""
+    session = st.session_state
+    return {key: session.get(key, default) for key, default in _FLAG_DEFAULTS.items()}
 
 @requires_admin
 def render_dashboard_v2():
@@ -38,8 +371,11 @@ def render_dashboard_v2():
     
     current_user = get_current_user()
     
+    flags = _snapshot_flags()
+    
     # Check if user is new (first time using guided interface)
-    is_new_user = not st.session_state.get('guided_dashboard_visited', False)
+    is_new_user = not flags['guided_dashboard_visited']
+    welcome_done = is_tutorial_completed("welcome_tutorial")
     
     # Header with welcome message
     col1, col2, col3 = st.columns([2, 1, 1])
@@ -55,7 +391,7 @@ def render_dashboard_v2():
         # Tutorial toggle
         show_tutorials = st.toggle(
             "📚 Show Tutorials", 
-            value=st.session_state.get('show_tutorials', True),
+            value=flags['show_tutorials'],
             help="Toggle tutorial overlays and guidance"
         )
         st.session_state['show_tutorials'] = show_tutorials
@@ -64,140 +400,110 @@ def render_dashboard_v2():
         # Help center button
         if st.button("❓ Help Center", use_container_width=True):
             st.session_state['show_help_center'] = True
+            flags['show_help_center'] = True
     
     # Mark as visited
     st.session_state['guided_dashboard_visited'] = True
     
     # Show initial tutorial for new users
     if is_new_user and show_tutorials:
-        render_welcome_tutorial()
+        render_welcome_tutorial(welcome_done)
     
     # Help center modal
-    if st.session_state.get('show_help_center', False):
+    if flags['show_help_center']:
         render_help_center()
     
     st.divider()
     
     # Getting Started Section (for new users)
-    if is_new_user or st.session_state.get('show_getting_started', False):
+    if is_new_user or flags['show_getting_started']:
         render_getting_started_section()
     
     # Main dashboard content with guidance
-    render_guided_main_content()
+    render_guided_main_content(flags)
     
     # Contextual help sidebar
     render_help_sidebar()
 
-def render_welcome_tutorial():
-    """Render welcome tutorial for new users"""
+@st.fragment
+def render_welcome_tutorial(welcome_done: bool):
+    """Render welcome tutorial for new users
+    
+    Runs as a fragment so stepping through the tutorial only reruns the
+    overlay; finishing or skipping reruns the page to update the checklist.
+    """
+    # Returning users skip straight out before any tutorial state is touched
+    if welcome_done:
+        return
+    
     tutorial_id = "welcome_tutorial"
     tutorial_state = manage_tutorial_state(tutorial_id)
     
-    if not is_tutorial_completed(tutorial_id):
-        tutorial_steps = [
-            {
-                "title": "Welcome to SafeSteps!",
-                "content": """
-                This guided dashboard is designed to help you manage certificates easily.
-                
-                **What you can do here:**
-                - Generate certificates for students
-                - Manage users and permissions
-                - Create and manage certificate templates
-                - View analytics and reports
-                
-                Let's take a quick tour!
-                """
-            },
-            {
-                "title": "Dashboard Layout",
-                "content": """
-                The dashboard is organized into clear sections:
-                
-                📊 **Quick Stats** - See your key metrics at a glance
-                🏆 **Certificate Management** - Your main tools for certificates
-                👥 **User Management** - Manage who can access the system
-                📄 **Templates** - Create and manage certificate designs
-                
-                Each section has helpful tooltips and guidance.
-                """
-            },
-            {
-                "title": "Getting Help",
-                "content": """
-                Look for these helpful features:
-                
-                🎓 **Tutorial icons** - Click for contextual help
-                ❓ **Help Center** - Comprehensive documentation
-                💡 **Tips** - Helpful hints throughout the interface
-                📚 **Guided workflows** - Step-by-step processes
-                
-                You can always toggle tutorials on/off in the top right.
-                """
-            }
-        ]
+    current_step = tutorial_state['current_step']
+    total_steps = len(_TUTORIAL_STEPS)
+    
+    if current_step <= total_steps:
+        step_data = _TUTORIAL_STEPS[current_step - 1]
         
-        current_step = tutorial_state['current_step']
-        total_steps = len(tutorial_steps)
+        nav_result = create_tutorial_overlay(
+            step_data['title'],
+            step_data['content'],
+            current_step,
+            total_steps,
+            content_html=_prerender_markdown(step_data['content'])
+        )
         
-        if current_step <= total_steps:
-            step_data = tutorial_steps[current_step - 1]
-            
-            nav_result = create_tutorial_overlay(
-                step_data['title'],
-                step_data['content'],
-                current_step,
-                total_steps
-            )
-            
-            if nav_result['next']:
-                if current_step < total_steps:
-                    advance_tutorial_step(tutorial_id)
-                    st.rerun()
-                else:
-                    complete_tutorial(tutorial_id)
-                    st.success("🎉 Welcome tutorial completed! You're ready to go.")
-                    st.rerun()
-            
-            if nav_result['prev'] and current_step > 1:
-                tutorial_state['current_step'] = current_step - 1
-                st.rerun()
-            
-            if nav_result['skip']:
-                skip_tutorial(tutorial_id)
-                st.info("Tutorial skipped. You can restart it anytime from the Help Center.")
+        if nav_result['next']:
+            if current_step < total_steps:
+                advance_tutorial_step(tutorial_id)
+                st.rerun(scope="fragment")
+            else:
+                complete_tutorial(tutorial_id)
+                st.success("🎉 Welcome tutorial completed! You're ready to go.")
                 st.rerun()
+        
+        if nav_result['prev'] and current_step > 1:
+            tutorial_state['current_step'] = current_step - 1
+            st.rerun(scope="fragment")
+        
+        if nav_result['skip']:
+            skip_tutorial(tutorial_id)
+            st.info("Tutorial skipped. You can restart it anytime from the Help Center.")
+            st.rerun()
 
+@st.fragment
 def render_getting_started_section():
-    """Render getting started section with quick actions"""
+    """Render getting started section with quick actions
+    
+    Runs as a fragment so its quick action buttons don't rerun the whole
+    dashboard; hiding the section reruns the page. Flags are read here
+    rather than passed in, since fragment reruns reuse the last arguments.
+    """
+    flags = _snapshot_flags()
+    welcome_done = is_tutorial_completed("welcome_tutorial")
+    
     with st.container(border=True):
         st.subheader("🚀 Getting Started")
         
         # Progress checklist
         checklist_items = [
-            {"key": "tutorial_completed", "label": "Complete welcome tutorial", "completed": is_tutorial_completed("welcome_tutorial")},
-            {"key": "first_certificate", "label": "Generate your first certificate", "completed": st.session_state.get('first_certificate_generated', False)},
-            {"key": "user_added", "label": "Add a team member", "completed": st.session_state.get('first_user_added', False)},
-            {"key": "template_customized", "label": "Customize a template", "completed": st.session_state.get('first_template_customized', False)}
+            {**item, "completed": _checklist_status(item, flags, welcome_done)} for item in _CHECKLIST_SKELETON
         ]
         
-        completed_count = sum(1 for item in checklist_items if item['completed'])
-        progress_percent = (completed_count / len(checklist_items)) * 100
+        completed_count, progress_fraction, progress_text = _setup_progress(
+            tuple(item['completed'] for item in checklist_items)
+        )
         
-        st.progress(progress_percent / 100, text=f"Setup Progress: {completed_count}/{len(checklist_items)} tasks completed")
+        st.progress(progress_fraction, text=progress_text)
         
         # Checklist
         col1, col2 = st.columns(2)
         
         with col1:
-            for item in checklist_items[:2]:
-                icon = "✅" if item['completed'] else "⭕"
-                st.markdown(f"{icon} {item['label']}")
+            st.markdown(_format_checklist(checklist_items[:2]))
         
         with col2:
-            for item in checklist_items[2:]:
-                icon = "✅" if item['completed'] else "⭕"
-                st.markdown(f"{icon} {item['label']}")
+            st.markdown(_format_checklist(checklist_items[2:]))
         
         # Quick start buttons
         st.markdown("**Quick Actions:**")
@@ -225,7 +531,7 @@ def render_getting_started_section():
                 st.session_state['show_getting_started'] = False
                 st.rerun()
 
-def render_guided_main_content():
+def render_guided_main_content(flags: Dict[str, bool]):
     """Render main dashboard content with contextual help"""
     
     # Key metrics with explanations
@@ -235,6 +541,26 @@ def render_guided_main_content():
         "🎓 About Dashboard Metrics"
     )
     
+    _render_metrics_fragment()
+    
+    st.divider()
+    
+    # Main action areas with guidance
+    col_left, col_right = st.columns([2, 1])
+    
+    with col_left:
+        render_certificate_management_guided(flags)
+        st.divider()
+        render_user_management_guided(flags)
+    
+    with col_right:
+        render_quick_actions_panel()
+        st.divider()
+        render_recent_activity_guided()
+
+@st.fragment
+def _render_metrics_fragment():
+    """Overview metric cards, isolated from reruns triggered elsewhere on the page"""
     metrics_cols = st.columns(4)
     
     with metrics_cols[0]:
@@ -272,23 +598,8 @@ def render_guided_main_content():
             "success"
         )
         create_help_tooltip("Overall system performance and availability.")
-    
-    st.divider()
-    
-    # Main action areas with guidance
-    col_left, col_right = st.columns([2, 1])
-    
-    with col_left:
-        render_certificate_management_guided()
-        st.divider()
-        render_user_management_guided()
-    
-    with col_right:
-        render_quick_actions_panel()
-        st.divider()
-        render_recent_activity_guided()
 
-def render_certificate_management_guided():
+def render_certificate_management_guided(flags: Dict[str, bool]):
     """Render certificate management with guidance"""
     col_header, col_help = st.columns([3, 1])
     
@@ -298,158 +609,150 @@ def render_certificate_management_guided():
     with col_help:
         if st.button("🎓 Certificate Help", key="cert_help"):
             st.session_state['show_certificate_help'] = True
+            flags['show_certificate_help'] = True
     
     # Certificate help modal
-    if st.session_state.get('show_certificate_help', False):
+    _render_help_modal('show_certificate_help', flags, "🏆 Certificate Management Help", _CERTIFICATE_HELP_MD)
+    
+    # Certificate actions with guidance (only the selected section is built)
+    active_tab = st.radio(
+        "Section", ["🚀 Quick Generate", "📋 Manage Batches", "📄 Templates"],
+        horizontal=True, key="cert_active_tab", label_visibility="collapsed"
+    )
+    
+    if active_tab == "🚀 Quick Generate":
+        _render_quick_generate_tab()
+    elif active_tab == "📋 Manage Batches":
+        _render_manage_batches_tab()
+    else:
+        _render_templates_tab()
+
+@st.fragment
+def _render_quick_generate_tab():
+    """Three-step certificate generation guide"""
+    st.markdown("**Generate certificates in 3 easy steps:**")
+    
+    # Step-by-step guidance
+    step_cols = st.columns(3)
+    
+    with step_cols[0]:
         with st.container(border=True):
-            st.markdown("### 🏆 Certificate Management Help")
-            st.markdown("""
-            **What are certificates?**
-            Digital certificates are awarded to students who complete courses or training.
-            
-            **How to generate certificates:**
-            1. **Upload student data** - CSV or Excel file with student names and emails
-            2. **Choose a template** - Select from existing templates or create custom ones
-            3. **Review and generate** - Check everything looks correct
-            4. **Download or email** - Get your certificates as PDF files
+            st.markdown("**Step 1: Upload Data**")
+            st.markdown("📤 Upload your student list")
             
-            **Tips for success:**
-            - Make sure your data file has 'name' and 'email' columns
-            - Preview templates before generating large batches
-            - Test with a small group first
-            """)
+            if st.button("📁 Choose File", use_container_width=True, type="primary"):
+                st.session_state['show_upload_wizard'] = True
             
-            if st.button("Close Help", type="primary"):
-                st.session_state['show_certificate_help'] = False
-                st.rerun()
+            create_help_tooltip(
+                "Upload a CSV or Excel file with student information. Required columns: 'name' and 'email'."
+            )
     
-    # Certificate actions with guidance
-    cert_tabs = st.tabs(["🚀 Quick Generate", "📋 Manage Batches", "📄 Templates"])
+    with step_cols[1]:
+        with st.container(border=True):
+            st.markdown("**Step 2: Pick Template**")
+            st.markdown("🎨 Choose certificate design")
+            
+            template_options = ["Digital Citizenship", "Safety Training", "Compliance Course"]
+            selected_template = st.selectbox(
+                "Template",
+                template_options,
+                key="guided_template_select",
+                help="Select the certificate template to use"
+            )
+            
+            create_help_tooltip(
+                "Templates define how your certificates look. You can preview them before generating."
+            )
     
-    with cert_tabs[0]:
-        st.markdown("**Generate certificates in 3 easy steps:**")
-        
-        # Step-by-step guidance
-        step_cols = st.columns(3)
-        
-        with step_cols[0]:
-            with st.container(border=True):
-                st.markdown("**Step 1: Upload Data**")
-                st.markdown("📤 Upload your student list")
-                
-                if st.button("📁 Choose File", use_container_width=True, type="primary"):
-                    st.session_state['show_upload_wizard'] = True
-                
-                create_help_tooltip(
-                    "Upload a CSV or Excel file with student information. Required columns: 'name' and 'email'."
-                )
-        
-        with step_cols[1]:
-            with st.container(border=True):
-                st.markdown("**Step 2: Pick Template**")
-                st.markdown("🎨 Choose certificate design")
-                
-                template_options = ["Digital Citizenship", "Safety Training", "Compliance Course"]
-                selected_template = st.selectbox(
-                    "Template",
-                    template_options,
-                    key="guided_template_select",
-                    help="Select the certificate template to use"
-                )
-                
-                create_help_tooltip(
-                    "Templates define how your certificates look. You can preview them before generating."
-                )
+    with step_cols[2]:
+        with st.container(border=True):
+            st.markdown("**Step 3: Generate**")
+            st.markdown("🏆 Create certificates")
+            
+            if st.button("✨ Generate Now", use_container_width=True, type="primary"):
+                st.success("🎉 Certificate generation started!")
+                st.session_state['first_certificate_generated'] = True
+                # In real app, this would start the generation process
+            
+            create_help_tooltip(
+                "Click to start generating certificates. You'll get a ZIP file with all certificates as PDFs."
+            )
+
+@st.fragment
+def _render_manage_batches_tab():
+    """Certificate batch table with batch actions"""
+    st.markdown("**Your Certificate Batches**")
+    
+    # Show recent batches with status in one table; selections are only sent on submit
+    batches_df = pd.DataFrame(_CERT_BATCHES)[['name', 'date', 'status', 'count']]
+    batches_df['status'] = batches_df['status'].map(_status_label)
+    batches_df.insert(0, 'select', False)
+    
+    with st.form("guided_batch_actions", clear_on_submit=False, border=False):
+        edited_batches = st.data_editor(
+            batches_df,
+            hide_index=True,
+            use_container_width=True,
+            key="guided_batch_editor",
+            column_config={
+                'select': st.column_config.CheckboxColumn("", width="small"),
+                'name': st.column_config.TextColumn("Batch"),
+                'date': st.column_config.TextColumn("Created"),
+                'status': st.column_config.TextColumn("Status"),
+                'count': st.column_config.NumberColumn("Certificates")
+            },
+            disabled=['name', 'date', 'status', 'count']
+        )
         
-        with step_cols[2]:
-            with st.container(border=True):
-                st.markdown("**Step 3: Generate**")
-                st.markdown("🏆 Create certificates")
-                
-                if st.button("✨ Generate Now", use_container_width=True, type="primary"):
-                    st.success("🎉 Certificate generation started!")
-                    st.session_state['first_certificate_generated'] = True
-                    # In real app, this would start the generation process
-                
-                create_help_tooltip(
-                    "Click to start generating certificates. You'll get a ZIP file with all certificates as PDFs."
-                )
+        batch_action_cols = st.columns(2)
+        with batch_action_cols[0]:
+            download_clicked = st.form_submit_button("📥 Download", use_container_width=True)
+        with batch_action_cols[1]:
+            generate_clicked = st.form_submit_button("🚀 Generate", use_container_width=True)
+    
+    selected_status = {
+        batch['status'] for batch, selected in zip(_CERT_BATCHES, edited_batches['select']) if selected
+    }
+    if download_clicked:
+        if 'Completed' in selected_status:
+            st.success("Download started!")
+        else:
+            st.warning("Select a completed batch to download.")
+    if generate_clicked:
+        if 'Ready' in selected_status:
+            st.success("Generation started!")
+        else:
+            st.warning("Select a ready batch to generate.")
+
+@st.fragment
+def _render_templates_tab():
+    """Template gallery with preview and use actions"""
+    st.markdown("**Available Templates**")
+    create_help_tooltip(
+        "Templates determine how your certificates look. You can use built-in templates or create custom ones."
+    )
     
-    with cert_tabs[1]:
-        st.markdown("**Your Certificate Batches**")
-        
-        # Show recent batches with status
-        batch_data = [
-            {"name": "January Safety Training", "status": "Completed", "count": 45, "date": "2024-01-15"},
-            {"name": "Q4 Compliance Certificates", "status": "Processing", "count": 23, "date": "2024-01-14"},
-            {"name": "Digital Citizenship Batch 3", "status": "Ready", "count": 67, "date": "2024-01-13"}
-        ]
-        
-        for batch in batch_data:
+    # Template gallery with previews
+    template_cols = st.columns(2)
+    
+    for idx, template in enumerate(_CERT_TEMPLATES):
+        col_idx = idx % 2
+        with template_cols[col_idx]:
             with st.container(border=True):
-                col1, col2, col3, col4 = st.columns([2, 1, 1, 1])
-                
-                with col1:
-                    st.markdown(f"**{batch['name']}**")
-                    st.caption(f"Created: {batch['date']}")
-                
-                with col2:
-                    status_colors = {"Completed": "success", "Processing": "info", "Ready": "warning"}
-                    status_color = status_colors.get(batch['status'], 'secondary')
-                    if status_color == "success":
-                        st.success(f"✅ {batch['status']}")
-                    elif status_color == "info":
-                        st.info(f"🔄 {batch['status']}")
-                    else:
-                        st.warning(f"⏳ {batch['status']}")
-                
-                with col3:
-                    st.metric("Certificates", batch['count'])
-                
-                with col4:
-                    if batch['status'] == 'Completed':
-                        if st.button("📥 Download", key=f"download_{batch['name']}"):
-                            st.success("Download started!")
-                    elif batch['status'] == 'Ready':
-                        if st.button("🚀 Generate", key=f"generate_{batch['name']}"):
-                            st.success("Generation started!")
-                    else:
-                        st.button("⏳ Processing", disabled=True)
-    
-    with cert_tabs[2]:
-        st.markdown("**Available Templates**")
-        create_help_tooltip(
-            "Templates determine how your certificates look. You can use built-in templates or create custom ones."
-        )
-        
-        # Template gallery with previews
-        template_cols = st.columns(2)
-        
-        templates = [
-            {"name": "Digital Citizenship", "description": "Modern design for digital literacy courses", "uses": 156},
-            {"name": "Safety Training", "description": "Professional template for safety certifications", "uses": 89},
-            {"name": "Compliance Course", "description": "Formal design for compliance training", "uses": 234},
-            {"name": "General Achievement", "description": "Versatile template for any course", "uses": 45}
-        ]
-        
-        for idx, template in enumerate(templates):
-            col_idx = idx % 2
-            with template_cols[col_idx]:
-                with st.container(border=True):
-                    st.markdown(f"**📄 {template['name']}**")
-                    st.caption(template['description'])
-                    st.text(f"Used {template['uses']} times")
-                    
-                    template_action_cols = st.columns(2)
-                    with template_action_cols[0]:
-                        if st.button("👁️ Preview", key=f"preview_{template['name']}", use_container_width=True):
-                            st.session_state[f'show_preview_{template["name"]}'] = True
-                    
-                    with template_action_cols[1]:
-                        if st.button("🚀 Use", key=f"use_{template['name']}", use_container_width=True):
-                            st.success(f"Using {template['name']} template!")
+                st.markdown(f"**📄 {template['name']}**")
+                st.caption(template['description'])
+                st.text(f"Used {template['uses']} times")
+                
+                template_action_cols = st.columns(2)
+                with template_action_cols[0]:
+                    if st.button("👁️ Preview", key=template['preview_key'], use_container_width=True):
+                        st.session_state[f'show_preview_{template["name"]}'] = True
+                
+                with template_action_cols[1]:
+                    if st.button("🚀 Use", key=template['use_key'], use_container_width=True):
+                        st.success(f"Using {template['name']} template!")
 
-def render_user_management_guided():
+def render_user_management_guided(flags: Dict[str, bool]):
     """Render user management with guidance"""
     col_header, col_help = st.columns([3, 1])
     
@@ -459,165 +762,138 @@ def render_user_management_guided():
     with col_help:
         if st.button("🎓 User Help", key="user_help"):
             st.session_state['show_user_help'] = True
+            flags['show_user_help'] = True
     
     # User help modal
-    if st.session_state.get('show_user_help', False):
-        with st.container(border=True):
-            st.markdown("### 👥 User Management Help")
-            st.markdown("""
-            **User Roles Explained:**
-            - **Admin**: Full access to all features, can manage other users
-            - **User**: Can generate certificates and view their own data
-            - **Guest**: Read-only access for viewing certificates
-            
-            **Adding Users:**
-            1. Click "Add New User"
-            2. Enter their name and email
-            3. Choose their role
-            4. They'll receive login instructions by email
-            
-            **Security Tips:**
-            - Only give admin access to trusted team members
-            - Regularly review user list and remove inactive accounts
-            - Use strong passwords and consider enabling 2FA
-            """)
-            
-            if st.button("Close Help", type="primary"):
-                st.session_state['show_user_help'] = False
-                st.rerun()
+    _render_help_modal('show_user_help', flags, "👥 User Management Help", _USER_HELP_MD)
     
-    # User management interface
-    user_tabs = st.tabs(["👤 Add User", "📋 Manage Users", "🔐 Permissions"])
+    # User management interface (only the selected section is built)
+    active_tab = st.radio(
+        "Section", ["👤 Add User", "📋 Manage Users", "🔐 Permissions"],
+        horizontal=True, key="user_active_tab", label_visibility="collapsed"
+    )
     
-    with user_tabs[0]:
-        st.markdown("**Add a new team member:**")
+    if active_tab == "👤 Add User":
+        _render_add_user_tab()
+    elif active_tab == "📋 Manage Users":
+        _render_manage_users_tab()
+    else:
+        _render_permissions_tab()
+
+@st.fragment
+def _render_add_user_tab():
+    """Add-user form with role guidance"""
+    st.markdown("**Add a new team member:**")
+    
+    with st.form("add_user_guided"):
+        col1, col2 = st.columns(2)
         
-        with st.form("add_user_guided"):
-            col1, col2 = st.columns(2)
-            
-            with col1:
-                new_username = st.text_input(
-                    "Username",
-                    placeholder="john.doe",
-                    help="Choose a unique username (letters, numbers, dots, underscores)"
-                )
-                
-                new_email = st.text_input(
-                    "Email Address",
-                    placeholder="john.doe@company.com",
-                    help="User's email address for login and notifications"
-                )
-            
-            with col2:
-                new_role = st.selectbox(
-                    "Role",
-                    ["user", "admin"],
-                    help="Choose user's permission level"
-                )
-                
-                send_welcome = st.checkbox(
-                    "Send Welcome Email",
-                    value=True,
-                    help="Automatically send login instructions"
-                )
-            
-            # Role explanation
-            if new_role == "admin":
-                st.info("👑 **Admin users** can manage all aspects of SafeSteps including other users.")
-            else:
-                st.info("👤 **Regular users** can generate certificates and manage their own data.")
-            
-            col_submit, col_cancel = st.columns(2)
+        with col1:
+            new_username = st.text_input(
+                "Username",
+                placeholder="john.doe",
+                help="Choose a unique username (letters, numbers, dots, underscores)"
+            )
             
-            with col_submit:
-                if st.form_submit_button("➕ Add User", type="primary", use_container_width=True):
-                    if new_username and new_email:
-                        st.success(f"✅ User {new_username} added successfully!")
-                        st.session_state['first_user_added'] = True
-                        if send_welcome:
-                            st.info("📧 Welcome email sent!")
-                    else:
-                        st.error("Please fill in all required fields.")
+            new_email = st.text_input(
+                "Email Address",
+                placeholder="john.doe@company.com",
+                help="User's email address for login and notifications"
+            )
+        
+        with col2:
+            new_role = st.selectbox(
+                "Role",
+                ["user", "admin"],
+                help="Choose user's permission level"
+            )
             
-            with col_cancel:
-                if st.form_submit_button("Cancel", use_container_width=True):
-                    st.info("User creation cancelled.")
-    
-    with user_tabs[1]:
-        st.markdown("**Current Users**")
-        
-        # User list with actions
-        users_data = [
-            {"username": "admin", "email": "admin@safesteps.local", "role": "admin", "status": "active", "last_login": "Today"},
-            {"username": "john.doe", "email": "john@company.com", "role": "user", "status": "active", "last_login": "Yesterday"},
-            {"username": "jane.smith", "email": "jane@company.com", "role": "user", "status": "inactive", "last_login": "1 week ago"}
-        ]
+            send_welcome = st.checkbox(
+                "Send Welcome Email",
+                value=True,
+                help="Automatically send login instructions"
+            )
         
-        for user in users_data:
-            with st.container(border=True):
-                col1, col2, col3, col4, col5 = st.columns([2, 2, 1, 1, 2])
-                
-                with col1:
-                    role_icon = "👑" if user['role'] == 'admin' else "👤"
-                    st.markdown(f"**{role_icon} {user['username']}**")
-                    st.caption(user['email'])
-                
-                with col2:
-                    st.text(f"Role: {user['role'].title()}")
-                    st.caption(f"Last login: {user['last_login']}")
-                
-                with col3:
-                    if user['status'] == 'active':
-                        st.success("🟢 Active")
-                    else:
-                        st.error("🔴 Inactive")
-                
-                with col4:
-                    if user['username'] != 'admin':  # Don't allow editing admin user
-                        if st.button("✏️ Edit", key=f"edit_user_{user['username']}"):
-                            st.session_state[f'edit_user_{user["username"]}'] = True
-                
-                with col5:
-                    if user['username'] != 'admin':  # Don't allow deleting admin user
-                        action_label = "🔓 Activate" if user['status'] == 'inactive' else "🔒 Deactivate"
-                        if st.button(action_label, key=f"toggle_user_{user['username']}"):
-                            new_status = "active" if user['status'] == 'inactive' else "inactive"
-                            st.success(f"User {user['username']} {new_status}!")
-    
-    with user_tabs[2]:
-        st.markdown("**Permission Settings**")
+        # Role explanation
+        if new_role == "admin":
+            st.info("👑 **Admin users** can manage all aspects of SafeSteps including other users.")
+        else:
+            st.info("👤 **Regular users** can generate certificates and manage their own data.")
         
-        # Permission explanations
-        with st.container(border=True):
-            st.markdown("**👑 Admin Permissions:**")
-            permissions = [
-                "✅ Generate certificates",
-                "✅ Manage all users",
-                "✅ Create and edit templates",
-                "✅ View all analytics",
-                "✅ System administration",
-                "✅ Export all data"
-            ]
-            
-            for perm in permissions:
-                st.markdown(perm)
+        col_submit, col_cancel = st.columns(2)
         
-        with st.container(border=True):
-            st.markdown("**👤 User Permissions:**")
-            permissions = [
-                "✅ Generate certificates",
-                "❌ Manage other users",
-                "❌ Create templates (can use existing)",
-                "✅ View own analytics",
-                "❌ System administration",
-                "✅ Export own data"
-            ]
-            
-            for perm in permissions:
-                if "❌" in perm:
-                    st.markdown(f":gray[{perm}]")
+        with col_submit:
+            if st.form_submit_button("➕ Add User", type="primary", use_container_width=True):
+                if new_username and new_email:
+                    st.success(f"✅ User {new_username} added successfully!")
+                    st.session_state['first_user_added'] = True
+                    if send_welcome:
+                        st.info("📧 Welcome email sent!")
                 else:
-                    st.markdown(perm)
+                    st.error("Please fill in all required fields.")
+        
+        with col_cancel:
+            if st.form_submit_button("Cancel", use_container_width=True):
+                st.info("User creation cancelled.")
+
+@st.fragment
+def _render_manage_users_tab():
+    """User table with edit and activation actions"""
+    st.markdown("**Current Users**")
+    
+    # User list in one table; actions apply to the selected (non-admin) users
+    users_df = pd.DataFrame(_USERS)
+    users_df['username'] = [
+        f"{'👑' if user['role'] == 'admin' else '👤'} {user['username']}" for user in _USERS
+    ]
+    users_df['role'] = users_df['role'].str.title()
+    users_df['status'] = users_df['status'].map(_status_label)
+    users_df.insert(0, 'select', False)
+    
+    edited_users = st.data_editor(
+        users_df,
+        hide_index=True,
+        use_container_width=True,
+        key="guided_user_editor",
+        column_config={
+            'select': st.column_config.CheckboxColumn("", width="small"),
+            'username': st.column_config.TextColumn("User"),
+            'email': st.column_config.TextColumn("Email"),
+            'role': st.column_config.TextColumn("Role"),
+            'status': st.column_config.TextColumn("Status"),
+            'last_login': st.column_config.TextColumn("Last login")
+        },
+        disabled=['username', 'email', 'role', 'status', 'last_login']
+    )
+    # Don't allow editing or deactivating the admin user
+    selected_users = [
+        user for user, selected in zip(_USERS, edited_users['select'])
+        if selected and user['username'] != 'admin'
+    ]
+    
+    user_action_cols = st.columns(2)
+    with user_action_cols[0]:
+        if st.button("✏️ Edit", key="edit_users", use_container_width=True, disabled=not selected_users):
+            for user in selected_users:
+                st.session_state[f'edit_user_{user["username"]}'] = True
+    with user_action_cols[1]:
+        if st.button("🔁 Activate / Deactivate", key="toggle_users", use_container_width=True,
+                     disabled=not selected_users):
+            for user in selected_users:
+                new_status = "active" if user['status'] == 'inactive' else "inactive"
+                st.success(f"User {user['username']} {new_status}!")
+
+@st.fragment
+def _render_permissions_tab():
+    """Admin vs. user permission summary"""
+    st.markdown("**Permission Settings**")
+    
+    # Permission explanations
+    with st.container(border=True):
+        st.markdown(_ADMIN_PERMISSIONS_MD)
+    
+    with st.container(border=True):
+        st.markdown(_USER_PERMISSIONS_MD)
 
 def render_quick_actions_panel():
     """Render quick actions panel with helpful shortcuts"""
@@ -627,21 +903,13 @@ def render_quick_actions_panel():
     )
     
     # Quick action buttons with descriptions
-    actions = [
-        {"label": "🏆 Generate Certificates", "desc": "Start the certificate creation process", "key": "quick_generate"},
-        {"label": "👤 Add User", "desc": "Invite a new team member", "key": "quick_add_user"},
-        {"label": "📄 Upload Template", "desc": "Add a new certificate design", "key": "quick_template"},
-        {"label": "📊 View Reports", "desc": "See usage and analytics", "key": "quick_reports"},
-        {"label": "💾 Backup Data", "desc": "Create a system backup", "key": "quick_backup"},
-        {"label": "⚙️ System Settings", "desc": "Configure SafeSteps", "key": "quick_settings"}
-    ]
-    
-    for action in actions:
+    for action in _QUICK_ACTIONS:
         with st.container(border=True):
             if st.button(action["label"], key=action["key"], use_container_width=True):
                 st.success(f"Starting: {action['desc']}")
             st.caption(action["desc"])
 
+@st.fragment
 def render_recent_activity_guided():
     """Render recent activity with explanations"""
     st.subheader("📝 Recent Activity")
@@ -649,29 +917,7 @@ def render_recent_activity_guided():
         "This shows the latest actions in your SafeSteps system. Helps you track what's happening."
     )
     
-    activities = [
-        {"time": "5 minutes ago", "user": "john.doe", "action": "generated 25 certificates", "icon": "🏆", "type": "success"},
-        {"time": "15 minutes ago", "user": "You", "action": "added new user jane.smith", "icon": "👤", "type": "info"},
-        {"time": "1 hour ago", "user": "jane.smith", "action": "logged in for the first time", "icon": "🔐", "type": "info"},
-        {"time": "2 hours ago", "user": "System", "action": "completed automatic backup", "icon": "💾", "type": "success"},
-        {"time": "3 hours ago", "user": "john.doe", "action": "uploaded new template", "icon": "📄", "type": "info"}
-    ]
-    
-    for activity in activities:
-        with st.container():
-            col1, col2, col3 = st.columns([0.5, 2.5, 1])
-            
-            with col1:
-                st.markdown(activity["icon"])
-            
-            with col2:
-                user_display = "**You**" if activity['user'] == 'You' else f"**{activity['user']}**"
-                st.markdown(f"{user_display} {activity['action']}")
-            
-            with col3:
-                st.caption(activity["time"])
-            
-            st.divider()
+    st.markdown(_RECENT_ACTIVITY_HTML, unsafe_allow_html=True)
 
 def render_help_sidebar():
     """Render contextual help in sidebar"""
@@ -681,43 +927,15 @@ def render_help_sidebar():
         # Context-sensitive help
         current_section = st.session_state.get('current_help_context', 'dashboard')
         
-        help_content = {
-            'dashboard': {
-                'title': '📊 Dashboard Help',
-                'content': '''
-                **Dashboard Overview:**
-                Your main control center for SafeSteps.
-                
-                **Key Sections:**
-                - Metrics: See your current stats
-                - Certificate Management: Create certificates
-                - User Management: Manage team access
-                - Quick Actions: Common shortcuts
-                '''
-            },
-            'certificates': {
-                'title': '🏆 Certificate Help',
-                'content': '''
-                **Certificate Generation:**
-                
-                1. Upload student data (CSV/Excel)
-                2. Choose a template design
-                3. Review and generate
-                4. Download or email results
-                
-                **File Requirements:**
-                - Must have 'name' column
-                - Must have 'email' column
-                - CSV or Excel format only
-                '''
-            }
-        }
-        
-        current_help = help_content.get(current_section, help_content['dashboard'])
+        current_help = _SIDEBAR_HELP.get(current_section, _SIDEBAR_HELP['dashboard'])
         
         with st.container(border=True):
-            st.markdown(f"**{current_help['title']}**")
-            st.markdown(current_help['content'])
+            help_html = _prerender_markdown(current_help['content'])
+            if help_html is not None:
+                st.html(f"<b>{html.escape(current_help['title'])}</b>{help_html}")
+            else:
+                st.markdown(f"**{current_help['title']}**")
+                st.markdown(current_help['content'])
         
         st.divider()
         
@@ -729,14 +947,7 @@ def render_help_sidebar():
             st.session_state['show_contact_support'] = True
         
         if st.button("🔄 Restart Tutorial", use_container_width=True):
-            # Reset welcome tutorial
-            st.session_state['tutorial_welcome_tutorial'] = {
-                'current_step': 1,
-                'completed_steps': [],
-                'skipped': False,
-                'started_at': datetime.now().isoformat(),
-                'completed_at': None
-            }
+            reset_tutorial("welcome_tutorial")
             st.success("Tutorial restarted!")
             st.rerun()
 
@@ -753,47 +964,29 @@ def render_help_center():
             with help_tabs[0]:
                 st.markdown("**Step-by-Step Guides:**")
                 
-                guides = [
-                    "🏆 How to Generate Your First Certificate",
-                    "👥 Managing Users and Permissions",
-                    "📄 Creating Custom Templates",
-                    "📊 Understanding Analytics",
-                    "💾 Backing Up Your Data",
-                    "⚙️ System Configuration"
-                ]
-                
-                for guide in guides:
-                    if st.button(guide, use_container_width=True):
-                        st.info(f"Opening: {guide}")
+                guide = st.radio(
+                    "Select a guide", _HELP_GUIDES, index=None,
+                    key="help_center_guide", label_visibility="collapsed"
+                )
+                if guide:
+                    st.info(f"Opening: {guide}")
             
             with help_tabs[1]:
                 st.markdown("**Frequently Asked Questions:**")
                 
-                faqs = [
-                    {"q": "What file formats can I upload?", "a": "SafeSteps accepts CSV and Excel (.xlsx) files with student data."},
-                    {"q": "How many certificates can I generate at once?", "a": "There's no limit! You can generate certificates for thousands of students in one batch."},
-                    {"q": "Can I customize the certificate design?", "a": "Yes! You can upload custom templates or modify existing ones."},
-                    {"q": "Are certificates secure?", "a": "Yes, all certificates include unique verification codes and digital signatures."}
-                ]
-                
-                for faq in faqs:
+                for faq in _HELP_FAQS:
                     with st.expander(faq["q"]):
                         st.markdown(faq["a"])
             
             with help_tabs[2]:
                 st.markdown("**Video Tutorials:**")
                 
-                tutorials = [
-                    "🎬 SafeSteps Overview (5 min)",
-                    "🎬 Generating Your First Certificate (3 min)",
-                    "🎬 Managing Users (4 min)",
-                    "🎬 Custom Templates (6 min)",
-                    "🎬 Advanced Features (8 min)"
-                ]
-                
-                for tutorial in tutorials:
-                    if st.button(tutorial, use_container_width=True):
-                        st.info(f"Playing: {tutorial}")
+                tutorial = st.radio(
+                    "Select a tutorial", _HELP_TUTORIALS, index=None,
+                    key="help_center_tutorial", label_visibility="collapsed"
+                )
+                if tutorial:
+                    st.info(f"Playing: {tutorial}")
             
             with help_tabs[3]:
                 st.markdown("**Get Support:**")
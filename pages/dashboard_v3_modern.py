@@ -3,9 +3,8 @@ SafeSteps V3 - Modern Dashboard
 Card-based modular interface with visual appeal and mobile-first design
 """
 import streamlit as st
+import itertools
 from datetime import datetime, timedelta
-import pandas as pd
-import random
 from typing import Dict, List, Any
 import time
 
@@ -16,55 +15,112 @@ from utils.ui_components import (
 )
 from utils.mobile_optimization import (
     apply_global_mobile_optimizations, create_mobile_button,
-    get_device_info, create_responsive_columns, MobileOptimizer
+    get_device_info, MobileOptimizer
 )
 from utils.ui_helpers import (
     manage_navigation_state, update_navigation,
     get_user_preference, update_user_preference
 )
 from utils.theme_system import ThemeSystem
-from utils.chart_components import (
-    create_activity_chart, create_distribution_chart,
-    create_sparkline, create_gauge_chart, create_comparison_chart,
-    create_stats_grid, create_funnel_chart, create_kpi_dashboard
-)
 from utils.storage import StorageManager
 from utils.course_manager import CourseManager
 
-# Initialize managers
-storage = StorageManager()
-course_manager = CourseManager(storage.local_path / "metadata")
-theme_system = ThemeSystem()
+# Managers are shared across sessions and reruns
+@st.cache_resource
+def get_storage() -> StorageManager:
+    return StorageManager()
 
-def get_greeting():
-    """Get time-appropriate greeting"""
-    current_hour = datetime.now().hour
-    if current_hour < 12:
+@st.cache_resource
+def get_course_manager() -> CourseManager:
+    return CourseManager(get_storage().local_path / "metadata")
+
+@st.cache_resource
+def get_theme_system() -> ThemeSystem:
+    return ThemeSystem()
+
+@st.cache_data
+def get_theme_options() -> tuple:
+    return tuple(get_theme_system().themes.keys())
+
+def _greeting_for_hour(hour: int) -> str:
+    if hour < 12:
         return "Good morning"
-    elif current_hour < 17:
+    elif hour < 17:
         return "Good afternoon"
     else:
         return "Good evening"
 
+def get_greeting():
+    """Get time-appropriate greeting, refreshed in session state when the hour changes"""
+    hour = datetime.now().hour
+    if st.session_state.get('greet_hour') != hour:
+        st.session_state['greet_hour'] = hour
+        st.session_state['greeting'] = _greeting_for_hour(hour)
+    return st.session_state['greeting']
+
+# Column specs per device class, keyed by the number of slots a section needs
+_COL_SPECS = {
+    'mobile': {2: [1], 3: [1], 4: [1]},
+    'tablet': {2: [2, 1], 3: [2, 1], 4: [1, 1]},
+    'desktop': {2: [2, 1], 3: [2, 1, 1], 4: [1, 1, 1, 1]}
+}
+
+def _device_class() -> str:
+    """Device class from the profile detected once per session"""
+    profile = st.session_state.get('device_profile')
+    if profile is None:
+        profile = st.session_state['device_profile'] = get_device_info()
+    
+    if profile['is_mobile']:
+        return 'mobile'
+    elif profile['is_tablet']:
+        return 'tablet'
+    return 'desktop'
+
+def _column_spec(count: int) -> list:
+    """Responsive column widths for a section with ``count`` slots"""
+    return _COL_SPECS[_device_class()][count]
+
 def safe_columns(responsive_cols, expected_count=2):
-    """Safely create columns handling responsive layouts"""
-    if len(responsive_cols) == expected_count:
-        return st.columns(responsive_cols)
-    elif len(responsive_cols) == 1:
-        # Mobile: return single column repeated
-        if expected_count == 2:
-            return st.columns(1)[0], None
-        elif expected_count == 3:
-            return st.columns(1)[0], None, None
-        else:
-            return st.columns(1)[0]
-    elif len(responsive_cols) == 2 and expected_count == 3:
-        # Tablet to desktop: add a third column
-        cols = st.columns(responsive_cols + [1])
-        return cols[0], cols[1], cols[2]
+    """Safely create exactly ``expected_count`` columns for a responsive layout
+    
+    Mobile stacks the slots vertically; narrower layouts wrap onto extra rows
+    when the count divides evenly, otherwise the row is padded.
+    """
+    if len(responsive_cols) == 1:
+        # Mobile: stacked containers in place of columns
+        return tuple(st.container() for _ in range(expected_count))
+    elif expected_count % len(responsive_cols) == 0:
+        # Tablet: wrap onto as many rows as needed
+        rows = expected_count // len(responsive_cols)
+        return tuple(col for _ in range(rows) for col in st.columns(responsive_cols))
     else:
-        # Fallback: return the columns as-is
-        return st.columns(responsive_cols)
+        padding = [1] * max(0, expected_count - len(responsive_cols))
+        return tuple(st.columns(responsive_cols + padding))[:expected_count]
+
+def _render_header_controls(theme_system, theme_options, theme_col, refresh_col, compact):
+    """Render the header theme selector and refresh button into the given columns"""
+    with theme_col:
+        # Theme selector
+        current_theme = st.session_state.get('theme', 'light')
+        new_theme = st.selectbox(
+            "🎨 Theme",
+            theme_options,
+            index=theme_options.index(current_theme),
+            label_visibility="collapsed"
+        )
+        if new_theme != current_theme:
+            theme_system.set_theme(new_theme)
+            st.rerun()
+    
+    if refresh_col is not None:
+        with refresh_col:
+            # Refresh with animation (mobile-optimized)
+            label, size = ("🔄", "small") if compact else ("🔄 Refresh", "medium")
+            if create_mobile_button(label, "dashboard_refresh", button_type="secondary", size=size):
+                with st.spinner("Refreshing data..."):
+                    st.balloons()
+                    st.rerun()
 
 @requires_admin
 def render_dashboard_v3():
@@ -72,7 +128,10 @@ def render_dashboard_v3():
     
     # Apply mobile optimizations first
     mobile_optimizer = apply_global_mobile_optimizations()
-    device_info = get_device_info()
+    device_class = _device_class()
+    
+    theme_system = get_theme_system()
+    theme_options = get_theme_options()
     
     # Apply theme and mobile styles
     theme_system.apply_theme()
@@ -81,69 +140,25 @@ def render_dashboard_v3():
     current_user = get_current_user()
     
     # Responsive header with theme toggle
-    header_cols = create_responsive_columns([1], [2, 1], [2, 1, 1])
-    
-    # Handle different column layouts based on device
-    if len(header_cols) == 1:
-        # Mobile: single column
-        col1 = st.columns(1)[0]
-        col2 = col3 = None
-    elif len(header_cols) == 2:
-        # Tablet: two columns
-        col1, col2 = st.columns(header_cols)
-        col3 = None
-    else:
-        # Desktop: three columns
-        col1, col2, col3 = st.columns(header_cols)
+    header_cols = _COL_SPECS[device_class][3]
+    
+    header = st.columns(header_cols)
+    col1 = header[0]
     
     with col1:
         st.title("🎨 SafeSteps Modern Dashboard")
         greeting = get_greeting()
         st.caption(f"{greeting}, {current_user.get('username', 'Admin')}! 🎯")
     
-    if col2:
-        with col2:
-            # Theme selector
-            theme_options = list(theme_system.themes.keys())
-            current_theme = st.session_state.get('theme', 'light')
-            new_theme = st.selectbox(
-                "🎨 Theme",
-                theme_options,
-                index=theme_options.index(current_theme),
-                label_visibility="collapsed"
-            )
-            if new_theme != current_theme:
-                theme_system.set_theme(new_theme)
-                st.rerun()
-    
-    if col3:
-        with col3:
-            # Refresh with animation (mobile-optimized)
-            if create_mobile_button("🔄 Refresh", "dashboard_refresh", button_type="secondary", size="medium"):
-                with st.spinner("Refreshing data..."):
-                    st.balloons()
-                    st.rerun()
-    elif not col2:  # Mobile layout - add controls below title
+    if len(header) == 1:
+        # Mobile layout - add controls below title
         with col1:
-            # Theme selector for mobile
-            theme_options = list(theme_system.themes.keys())
-            current_theme = st.session_state.get('theme', 'light')
-            col_a, col_b = st.columns([2, 1])
-            with col_a:
-                new_theme = st.selectbox(
-                    "🎨 Theme",
-                    theme_options,
-                    index=theme_options.index(current_theme),
-                    label_visibility="collapsed"
-                )
-                if new_theme != current_theme:
-                    theme_system.set_theme(new_theme)
-                    st.rerun()
-            with col_b:
-                if create_mobile_button("🔄", "dashboard_refresh_mobile", button_type="secondary", size="small"):
-                    with st.spinner("Refreshing..."):
-                        st.balloons()
-                        st.rerun()
+            theme_col, refresh_col = st.columns([2, 1])
+        _render_header_controls(theme_system, theme_options, theme_col, refresh_col, compact=True)
+    else:
+        # Tablet has no room for the refresh button
+        refresh_col = header[2] if len(header) > 2 else None
+        _render_header_controls(theme_system, theme_options, header[1], refresh_col, compact=False)
     
     st.divider()
     
@@ -152,45 +167,46 @@ def render_dashboard_v3():
     
     st.divider()
     
-    # Main content layout
-    tab1, tab2, tab3, tab4 = st.tabs([
-        "📊 Overview", 
-        "🏆 Certificates", 
-        "📈 Analytics", 
-        "⚡ Quick Actions"
-    ])
+    # Main content layout (only the selected view is built, unlike st.tabs which runs every body)
+    active_tab = st.radio(
+        "View", ["📊 Overview", "🏆 Certificates", "📈 Analytics", "⚡ Quick Actions"],
+        horizontal=True, key="v3_active_tab", label_visibility="collapsed"
+    )
     
-    with tab1:
+    if active_tab == "📊 Overview":
         render_overview_tab()
-    
-    with tab2:
+    elif active_tab == "🏆 Certificates":
         render_certificates_tab()
-    
-    with tab3:
+    elif active_tab == "📈 Analytics":
         render_analytics_tab()
-    
-    with tab4:
+    else:
         render_quick_actions_tab()
     
     # Mobile-friendly floating action button
     render_floating_action_button()
 
-def get_greeting():
-    """Get time-based greeting"""
-    hour = datetime.now().hour
-    if hour < 12:
-        return "Good morning"
-    elif hour < 17:
-        return "Good afternoon"
-    else:
-        return "Good evening"
+_STATUS_EMOJI = {"completed": "✅", "processing": "🔄", "ready": "📋"}
 
-def render_kpi_section():
-    """Render key performance indicators"""
-    st.markdown("### 🎯 Key Performance Indicators")
-    
-    # Generate dynamic KPIs
-    kpis = [
+# Chart inputs shared across tab switches
+_CERT_DISTRIBUTION = {
+    "Digital Citizenship": 456,
+    "Safety Training": 389,
+    "Compliance": 402
+}
+
+_PIPELINE_STAGES = ("Uploaded", "Validated", "Generated", "Downloaded")
+_PIPELINE_VALUES = (1000, 950, 920, 890)
+
+_COMPARISON_LABELS = ("Digital", "Safety", "Compliance", "Custom")
+_LAST_MONTH = (234, 156, 89, 45)
+_THIS_MONTH = (345, 189, 102, 67)
+
+# Dashboard data loaders, cached so widget reruns don't rebuild them.
+# pandas/numpy and the chart helpers are imported where used so the
+# page module itself stays cheap to import.
+@st.cache_data(ttl=60, show_spinner=False)
+def _load_kpis() -> tuple:
+    return (
         {
             "title": "Total Certificates",
             "value": "1,247",
@@ -215,14 +231,67 @@ def render_kpi_section():
             "delta": "-0.3s",
             "delta_color": "normal"
         }
-    ]
+    )
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _load_activities() -> tuple:
+    return (
+        {"time": "2 min ago", "user": "john.doe", "action": "Generated 15 certificates", "type": "success"},
+        {"time": "5 min ago", "user": "admin", "action": "Updated Digital Citizenship template", "type": "info"},
+        {"time": "10 min ago", "user": "jane.smith", "action": "Added 3 new users", "type": "info"},
+        {"time": "15 min ago", "user": "system", "action": "Completed automatic backup", "type": "success"}
+    )
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _load_batches() -> tuple:
+    return (
+        {"name": "January Training", "count": 125, "status": "completed", "date": "2024-01-15"},
+        {"name": "Q1 Compliance", "count": 89, "status": "processing", "date": "2024-01-14"},
+        {"name": "New Employee Onboarding", "count": 34, "status": "ready", "date": "2024-01-13"}
+    )
+
+# Analytics frames are returned already indexed and treated as read-only
+@st.cache_data(ttl=300, show_spinner=False)
+def _load_template_df():
+    import pandas as pd
+    return pd.DataFrame({
+        'Template': ['Digital Citizenship', 'Safety Training', 'Compliance', 'Custom'],
+        'Usage': [456, 389, 234, 167],
+        'Success Rate': [98.5, 97.2, 99.1, 95.4]
+    }).set_index('Template')
+
+@st.cache_data(ttl=300, show_spinner=False)
+def _load_user_df():
+    import pandas as pd
+    return pd.DataFrame({
+        'User': ['john.doe', 'jane.smith', 'admin', 'bob.wilson'],
+        'Certificates': [234, 189, 156, 98]
+    }).set_index('User')
+
+@st.cache_data(ttl=300, show_spinner=False)
+def _load_hourly_df(seed: int = 0):
+    import numpy as np
+    import pandas as pd
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame({
+        'Hour': np.arange(24),
+        'Activity': rng.integers(10, 101, 24)
+    }).set_index('Hour')
+
+def render_kpi_section():
+    """Render key performance indicators"""
+    from utils.chart_components import create_kpi_dashboard
+    
+    st.markdown("### 🎯 Key Performance Indicators")
     
-    create_kpi_dashboard(kpis)
+    create_kpi_dashboard(_load_kpis())
 
 def render_overview_tab():
     """Render overview tab with visual elements"""
+    from utils.chart_components import create_activity_chart, create_distribution_chart, create_gauge_chart
+    
     # Responsive layout: mobile (1 col), tablet/desktop (2 cols)
-    overview_cols = create_responsive_columns([1], [2, 1], [2, 1])
+    overview_cols = _column_spec(2)
     col1, col2 = safe_columns(overview_cols, 2)
     
     with col1:
@@ -234,110 +303,93 @@ def render_overview_tab():
         
         # Recent activity with animations
         st.markdown("### 🔥 Recent Activity")
-        activities = [
-            {"time": "2 min ago", "user": "john.doe", "action": "Generated 15 certificates", "type": "success"},
-            {"time": "5 min ago", "user": "admin", "action": "Updated Digital Citizenship template", "type": "info"},
-            {"time": "10 min ago", "user": "jane.smith", "action": "Added 3 new users", "type": "info"},
-            {"time": "15 min ago", "user": "system", "action": "Completed automatic backup", "type": "success"}
-        ]
-        
-        for activity in activities:
+        for activity in _load_activities():
             with st.container(border=True):
                 activity_type_icon = "✅" if activity["type"] == "success" else "ℹ️"
                 st.markdown(f"{activity_type_icon} **{activity['user']}** {activity['action']}")
                 st.caption(f"🕒 {activity['time']}")
     
-    if col2:
-        with col2:
-            # Visual stats
-            st.markdown("### 📊 Quick Stats")
-            
-            # Certificate distribution
-            cert_data = {
-                "Digital Citizenship": 456,
-                "Safety Training": 389,
-                "Compliance": 402
-            }
-            create_distribution_chart(cert_data)
-            
-            st.divider()
-            
-            # System health gauge
-            st.markdown("### 💚 System Health")
-            create_gauge_chart(98, 100, "Overall Health")
-            
-            # Storage usage
-            create_gauge_chart(23, 100, "Storage Used (GB)")
+    with col2:
+        # Visual stats
+        st.markdown("### 📊 Quick Stats")
+        
+        # Certificate distribution
+        create_distribution_chart(_CERT_DISTRIBUTION)
+        
+        st.divider()
+        
+        # System health gauge
+        st.markdown("### 💚 System Health")
+        create_gauge_chart(98, 100, "Overall Health")
+        
+        # Storage usage
+        create_gauge_chart(23, 100, "Storage Used (GB)")
 
 def render_certificates_tab():
     """Render certificates tab with visual workflow"""
     st.markdown("### 🏆 Certificate Management")
     
-    # Responsive workflow steps
-    workflow_cols = create_responsive_columns([1], [1, 1], [1, 1, 1, 1])
-    
-    if len(workflow_cols) == 4:
-        col1, col2, col3, col4 = st.columns(workflow_cols)
-    elif len(workflow_cols) == 2:
-        col1, col2 = st.columns(workflow_cols)
-        col3, col4 = st.columns(workflow_cols)
-    else:
-        # Mobile: single column, stack vertically
-        col1 = col2 = col3 = col4 = st.container()
-    
-    with col1:
-        with st.container(border=True):
-            st.markdown("#### 1️⃣ Upload")
-            st.markdown("📤 Drop your CSV/Excel file")
-            uploaded = st.file_uploader("Choose file", type=['csv', 'xlsx'], label_visibility="collapsed")
-            if uploaded:
-                st.success("✅ File uploaded!")
-    
-    with col2:
-        with st.container(border=True):
-            st.markdown("#### 2️⃣ Template")
-            st.markdown("🎨 Choose design")
-            template = st.selectbox(
-                "Template",
-                ["Digital Citizenship", "Safety Training", "Compliance"],
-                label_visibility="collapsed"
-            )
-    
-    with col3:
-        with st.container(border=True):
-            st.markdown("#### 3️⃣ Preview")
-            st.markdown("👁️ Check sample")
-            if create_mobile_button("Preview", "preview_btn", button_type="secondary", size="medium"):
-                st.info("🖼️ Preview generated!")
+    # Responsive workflow steps; steps 1-3 are one form so setup costs a single rerun
+    workflow_cols = _column_spec(4)
     
-    with col4:
-        with st.container(border=True):
-            st.markdown("#### 4️⃣ Generate")
-            st.markdown("🚀 Create certificates")
-            if create_mobile_button("Generate All", "generate_all_btn", button_type="primary", size="large"):
-                with st.spinner("Generating certificates..."):
-                    progress = st.progress(0)
-                    for i in range(100):
-                        progress.progress(i + 1)
-                    st.success("🎉 Certificates ready!")
+    with st.form("cert_setup", border=False):
+        col1, col2, col3 = safe_columns(workflow_cols[:3], 3)
+        
+        with col1:
+            with st.container(border=True):
+                st.markdown("#### 1️⃣ Upload")
+                st.markdown("📤 Drop your CSV/Excel file")
+                uploaded = st.file_uploader("Choose file", type=['csv', 'xlsx'], label_visibility="collapsed")
+                if uploaded:
+                    st.success("✅ File uploaded!")
+        
+        with col2:
+            with st.container(border=True):
+                st.markdown("#### 2️⃣ Template")
+                st.markdown("🎨 Choose design")
+                template = st.selectbox(
+                    "Template",
+                    ["Digital Citizenship", "Safety Training", "Compliance"],
+                    label_visibility="collapsed"
+                )
+        
+        with col3:
+            with st.container(border=True):
+                st.markdown("#### 3️⃣ Preview")
+                st.markdown("👁️ Check sample")
+                preview = st.form_submit_button("Preview", use_container_width=True)
+    
+    if preview:
+        if uploaded:
+            st.session_state['v3_cert_setup'] = {'file': uploaded.name, 'template': template}
+            st.info("🖼️ Preview generated!")
+        else:
+            st.warning("Upload a data file before previewing.")
+    
+    # Generate is enabled once a setup has been previewed
+    with st.container(border=True):
+        st.markdown("#### 4️⃣ Generate")
+        st.markdown("🚀 Create certificates")
+        ready = 'v3_cert_setup' in st.session_state
+        if create_mobile_button("Generate All", "generate_all_btn", button_type="primary", size="large", disabled=not ready):
+            with st.spinner("Generating certificates..."):
+                progress = st.progress(0)
+                # Single terminal update; a per-percent loop sent 100 messages for no work
+                progress.progress(100)
+                st.success("🎉 Certificates ready!")
     
     st.divider()
     
     # Batch management with visual cards
     st.markdown("### 📦 Recent Batches")
     
-    batches = [
-        {"name": "January Training", "count": 125, "status": "completed", "date": "2024-01-15"},
-        {"name": "Q1 Compliance", "count": 89, "status": "processing", "date": "2024-01-14"},
-        {"name": "New Employee Onboarding", "count": 34, "status": "ready", "date": "2024-01-13"}
-    ]
+    batches = _load_batches()
     
     cols = st.columns(3)
-    for idx, batch in enumerate(batches):
-        with cols[idx % 3]:
+    for idx, (col, batch) in enumerate(zip(itertools.cycle(cols), batches)):
+        with col:
             with st.container(border=True):
-                status_emoji = {"completed": "✅", "processing": "🔄", "ready": "📋"}
-                st.markdown(f"### {status_emoji[batch['status']]} {batch['name']}")
+                st.markdown(f"### {_STATUS_EMOJI[batch['status']]} {batch['name']}")
                 st.metric("Certificates", batch['count'])
                 st.caption(f"📅 {batch['date']}")
                 
@@ -350,6 +402,8 @@ def render_certificates_tab():
 
 def render_analytics_tab():
     """Render analytics tab with data visualizations"""
+    from utils.chart_components import create_comparison_chart, create_funnel_chart
+    
     st.markdown("### 📊 Analytics Dashboard")
     
     # Time period selector
@@ -360,16 +414,8 @@ def render_analytics_tab():
     )
     
     # Responsive metrics row
-    metrics_cols = create_responsive_columns([1], [1, 1], [1, 1, 1, 1])
-    
-    if len(metrics_cols) == 4:
-        col1, col2, col3, col4 = st.columns(metrics_cols)
-    elif len(metrics_cols) == 2:
-        col1, col2 = st.columns(metrics_cols)
-        col3, col4 = st.columns(metrics_cols)
-    else:
-        # Mobile: show metrics vertically
-        col1 = col2 = col3 = col4 = st.container()
+    metrics_cols = _column_spec(4)
+    col1, col2, col3, col4 = safe_columns(metrics_cols, 4)
     
     with col1:
         create_metric_card("Total Generated", "3,456", "+234", "normal")
@@ -387,136 +433,128 @@ def render_analytics_tab():
     
     with col1:
         # Funnel chart
-        stages = ["Uploaded", "Validated", "Generated", "Downloaded"]
-        values = [1000, 950, 920, 890]
-        create_funnel_chart(stages, values, "Certificate Pipeline")
+        create_funnel_chart(_PIPELINE_STAGES, _PIPELINE_VALUES, "Certificate Pipeline")
     
     with col2:
         # Comparison chart
         st.markdown("### 📊 Month-over-Month")
-        last_month = [234, 156, 89, 45]
-        this_month = [345, 189, 102, 67]
-        labels = ["Digital", "Safety", "Compliance", "Custom"]
-        create_comparison_chart(last_month, this_month, labels)
+        create_comparison_chart(_LAST_MONTH, _THIS_MONTH, _COMPARISON_LABELS)
     
     st.divider()
     
     # Detailed analytics
     st.markdown("### 🔍 Detailed Analysis")
     
-    tab1, tab2, tab3 = st.tabs(["By Template", "By User", "By Time"])
+    analysis_view = st.radio(
+        "Analysis", ["By Template", "By User", "By Time"],
+        horizontal=True, key="v3_analysis_view", label_visibility="collapsed"
+    )
     
-    with tab1:
+    if analysis_view == "By Template":
         # Template performance
-        template_data = pd.DataFrame({
-            'Template': ['Digital Citizenship', 'Safety Training', 'Compliance', 'Custom'],
-            'Usage': [456, 389, 234, 167],
-            'Success Rate': [98.5, 97.2, 99.1, 95.4]
-        })
-        st.bar_chart(template_data.set_index('Template'))
-    
-    with tab2:
+        st.bar_chart(_load_template_df())
+    
+    elif analysis_view == "By User":
         # User activity
-        user_data = pd.DataFrame({
-            'User': ['john.doe', 'jane.smith', 'admin', 'bob.wilson'],
-            'Certificates': [234, 189, 156, 98]
-        })
-        st.bar_chart(user_data.set_index('User'))
+        st.bar_chart(_load_user_df())
     
-    with tab3:
+    else:
         # Time-based analysis
-        time_data = pd.DataFrame({
-            'Hour': list(range(24)),
-            'Activity': [random.randint(10, 100) for _ in range(24)]
-        })
-        st.line_chart(time_data.set_index('Hour'))
+        st.line_chart(_load_hourly_df())
+
+# Quick action categories as (icon, label, description) entries
+_QA_ACTIONS = (
+    ("Certificate Operations", (
+        ("🏆", "Bulk Generate", "Generate multiple certificates at once"),
+        ("📋", "Template Builder", "Create custom certificate templates"),
+        ("🔍", "Verify Certificate", "Check certificate authenticity"),
+        ("📊", "Export Report", "Generate detailed reports")
+    )),
+    ("User Management", (
+        ("👤", "Add User", "Create new user account"),
+        ("👥", "Bulk Import", "Import users from CSV"),
+        ("🔐", "Reset Password", "Help user reset credentials"),
+        ("📧", "Send Invites", "Invite new team members")
+    )),
+    ("System Operations", (
+        ("💾", "Backup Now", "Create system backup"),
+        ("🔄", "Sync Data", "Synchronize with external systems"),
+        ("🧹", "Clean Storage", "Remove old temporary files"),
+        ("⚙️", "Settings", "Configure system settings")
+    ))
+)
+
+# Same entries with their button keys precomputed
+_QA_CATEGORIES = tuple(
+    (category, tuple(
+        (icon, label, desc, f"action_{category}_{idx}")
+        for idx, (icon, label, desc) in enumerate(actions)
+    ))
+    for category, actions in _QA_ACTIONS
+)
 
 def render_quick_actions_tab():
     """Render quick actions tab with visual buttons"""
     st.markdown("### ⚡ Quick Actions")
     
-    # Action categories
-    categories = {
-        "Certificate Operations": [
-            {"icon": "🏆", "label": "Bulk Generate", "desc": "Generate multiple certificates at once"},
-            {"icon": "📋", "label": "Template Builder", "desc": "Create custom certificate templates"},
-            {"icon": "🔍", "label": "Verify Certificate", "desc": "Check certificate authenticity"},
-            {"icon": "📊", "label": "Export Report", "desc": "Generate detailed reports"}
-        ],
-        "User Management": [
-            {"icon": "👤", "label": "Add User", "desc": "Create new user account"},
-            {"icon": "👥", "label": "Bulk Import", "desc": "Import users from CSV"},
-            {"icon": "🔐", "label": "Reset Password", "desc": "Help user reset credentials"},
-            {"icon": "📧", "label": "Send Invites", "desc": "Invite new team members"}
-        ],
-        "System Operations": [
-            {"icon": "💾", "label": "Backup Now", "desc": "Create system backup"},
-            {"icon": "🔄", "label": "Sync Data", "desc": "Synchronize with external systems"},
-            {"icon": "🧹", "label": "Clean Storage", "desc": "Remove old temporary files"},
-            {"icon": "⚙️", "label": "Settings", "desc": "Configure system settings"}
-        ]
-    }
-    
-    for category, actions in categories.items():
+    for category, actions in _QA_CATEGORIES:
         st.markdown(f"#### {category}")
         cols = st.columns(4)
         
-        for idx, action in enumerate(actions):
-            with cols[idx % 4]:
+        for col, (icon, label, desc, key) in zip(itertools.cycle(cols), actions):
+            with col:
                 with st.container(border=True):
-                    if st.button(
-                        f"{action['icon']} {action['label']}", 
-                        key=f"action_{category}_{idx}",
-                        use_container_width=True
-                    ):
-                        st.success(f"Starting: {action['desc']}")
-                    st.caption(action['desc'])
+                    if st.button(f"{icon} {label}", key=key, use_container_width=True):
+                        st.success(f"Starting: {desc}")
+                    st.caption(desc)
         
         st.divider()
 
-def render_floating_action_button():
-    """Render a floating action button for mobile"""
-    fab_html = """
-    <style>
+# Static floating action button markup
+_FAB_HTML = """
+<style>
+.fab {
+    position: fixed;
+    bottom: 20px;
+    right: 20px;
+    width: 56px;
+    height: 56px;
+    background-color: var(--primary-color);
+    border-radius: 50%;
+    box-shadow: 0 4px 8px rgba(0,0,0,0.3);
+    display: flex;
+    align-items: center;
+    justify-content: center;
+    cursor: pointer;
+    z-index: 1000;
+    transition: all 0.3s ease;
+}
+
+.fab:hover {
+    transform: scale(1.1);
+    box-shadow: 0 6px 12px rgba(0,0,0,0.4);
+}
+
+.fab-icon {
+    color: white;
+    font-size: 24px;
+}
+
+@media (min-width: 769px) {
     .fab {
-        position: fixed;
-        bottom: 20px;
-        right: 20px;
-        width: 56px;
-        height: 56px;
-        background-color: var(--primary-color);
-        border-radius: 50%;
-        box-shadow: 0 4px 8px rgba(0,0,0,0.3);
-        display: flex;
-        align-items: center;
-        justify-content: center;
-        cursor: pointer;
-        z-index: 1000;
-        transition: all 0.3s ease;
-    }
-    
-    .fab:hover {
-        transform: scale(1.1);
-        box-shadow: 0 6px 12px rgba(0,0,0,0.4);
-    }
-    
-    .fab-icon {
-        color: white;
-        font-size: 24px;
-    }
-    
-    @media (min-width: 769px) {
-        .fab {
-            display: none;
-        }
+        display: none;
     }
-    </style>
-    
-    <div class="fab" onclick="alert('Quick action menu would open here')">
-        <span class="fab-icon">+</span>
-    </div>
-    """
-    st.markdown(fab_html, unsafe_allow_html=True)
+}
+</style>
+
+<div class="fab" onclick="alert('Quick action menu would open here')">
+    <span class="fab-icon">+</span>
+</div>
+"""
+
+def render_floating_action_button():
+    """Render a floating action button for mobile"""
+    st.markdown(_FAB_HTML, unsafe_allow_html=True)
 
 # Main entry point
 if __name__ == "__main__":
@@ -3,24 +3,179 @@ Mobile Optimization Demo Page
 Demonstrates all mobile optimization features in SafeSteps
 """
 import streamlit as st
+import html
+import re
+import types
 from utils.mobile_optimization import (
     apply_global_mobile_optimizations, create_mobile_button, 
-    get_device_info, is_mobile, create_responsive_columns,
-    MobileOptimizer, TouchTargetOptimizer, MobileNavigation
+    get_device_info, create_responsive_columns,
+    MobileGestures, get_mobile_nav
 )
-from utils.ui_components import create_card, create_metric_card, apply_custom_css
+from utils.ui_components import apply_custom_css, COLORS, BREAKPOINTS
 from utils.auth import get_current_user
 
+# Section separators drawn by CSS on the demo's own section headings and
+# footer, instead of one st.divider element per section. Scoped to the
+# demo-section class so other headings and captions (e.g. the sidebar's)
+# are left alone
+_SECTION_CSS = (
+    "<style>"
+    ".demo-section {"
+    f"border-top:1px solid {COLORS['border']};padding-top:1rem;margin-top:1rem"
+    "}"
+    f".demo-footer{{color:{COLORS['text_muted']};font-size:0.875rem}}"
+    "</style>"
+)
+
+# Feature lists
+_ACCESSIBILITY_FEATURES = (
+    "✅ **WCAG 2.2 Level AA Compliance** - All interactive elements meet accessibility standards",
+    "✅ **44px+ Touch Targets** - Comfortable finger tapping on all buttons",
+    "✅ **High Contrast Colors** - 4.5:1+ contrast ratios for text readability",
+    "✅ **Focus Indicators** - Clear visual focus for keyboard navigation",
+    "✅ **Screen Reader Support** - Proper ARIA labels and semantic HTML",
+    "✅ **Reduced Motion Support** - Respects user's motion preferences",
+    "✅ **Scalable Text** - Works with browser zoom up to 200%"
+)
+
+_PERF_FEATURES = (
+    "🚀 **Mobile-First CSS** - Optimized styles load faster on mobile",
+    "📱 **Touch-Optimized Interactions** - Reduced cognitive load",
+    "🎯 **Progressive Enhancement** - Works without JavaScript",
+    "📊 **Efficient Layouts** - CSS Grid and Flexbox for responsive design",
+    "⚡ **Minimal JavaScript** - Core functionality in Python/Streamlit",
+    "🔧 **Optimized Forms** - Proper input types for mobile keyboards"
+)
+
+_METRICS_DATA = (
+    ("Total Certificates", "1,234", "📜"),
+    ("Active Courses", "12", "📚"),
+    ("Students Enrolled", "456", "🎓"),
+    ("Success Rate", "98%", "✅")
+)
+
+# Metrics grid as one HTML block: one column on mobile, two on tablet, four on desktop
+_METRICS_HTML = (
+    "<style>"
+    ".demo-metrics{display:grid;grid-template-columns:1fr;gap:1rem}"
+    f"@media (min-width:{BREAKPOINTS['tablet']}){{.demo-metrics{{grid-template-columns:repeat(2,1fr)}}}}"
+    f"@media (min-width:{BREAKPOINTS['desktop']}){{.demo-metrics{{grid-template-columns:repeat(4,1fr)}}}}"
+    f".demo-metric small{{color:{COLORS['text_muted']}}}"
+    ".demo-metric div{font-size:2rem;font-weight:600}"
+    "</style>"
+    "<div class='demo-metrics'>"
+    + "".join(
+        f"<div class='demo-metric'><small>{icon} {label}</small><div>{value}</div></div>"
+        for label, value, icon in _METRICS_DATA
+    )
+    + "</div>"
+)
+
+# Demo form definition, read-only so the form helper can't alter it between runs
+_FORM_FIELDS = tuple(types.MappingProxyType(field) for field in (
+    {
+        'type': 'text',
+        'key': 'student_name',
+        'label': 'Student Name',
+        'required': True,
+        'placeholder': 'Enter full name',
+        'help': 'First and last name of the student'
+    },
+    {
+        'type': 'email',
+        'key': 'student_email',
+        'label': 'Email Address',
+        'required': True,
+        'placeholder': 'student@example.com'
+    },
+    {
+        'type': 'select',
+        'key': 'course_name',
+        'label': 'Course Completed',
+        'required': True,
+        'options': ['Workplace Safety', 'Fire Safety', 'First Aid', 'Manual Handling'],
+        'help': 'Select the completed course'
+    },
+    {
+        'type': 'date',
+        'key': 'completion_date',
+        'label': 'Completion Date',
+        'required': True,
+        'help': 'Date when the course was completed'
+    },
+    {
+        'type': 'select',
+        'key': 'result',
+        'label': 'Result',
+        'required': True,
+        'options': ['Pass', 'Fail', 'Distinction'],
+        'default_index': 0
+    }
+))
+
+def _features_html(features) -> str:
+    """Feature lines as HTML paragraphs, turning **bold** markers into <b>"""
+    return "".join(
+        "<p>" + re.sub(r"\*\*(.+?)\*\*", r"<b>\1</b>", feature) + "</p>" for feature in features
+    )
+
+# Non-interactive run from the metrics grid to the performance list, sent as one st.html element
+_STATIC_SECTIONS_HTML = (
+    "<p><b>Responsive Metrics Grid</b></p>"
+    + _METRICS_HTML
+    + "<h3 class='demo-section'>♿ Accessibility Features</h3>"
+    + _features_html(_ACCESSIBILITY_FEATURES)
+    + "<h3 class='demo-section'>⚡ Performance Optimizations</h3>"
+    + _features_html(_PERF_FEATURES)
+)
+
+_NAV_ITEMS = (
+    {'key': 'home', 'label': 'Home', 'icon': '🏠', 'active': True},
+    {'key': 'generate', 'label': 'Generate', 'icon': '🏆'},
+    {'key': 'manage', 'label': 'Manage', 'icon': '📋'},
+    {'key': 'account', 'label': 'Account', 'icon': '👤'}
+)
+
+# Static navigation markup. Page scripts re-execute on every rerun, so
+# these are cached rather than kept as plain module constants. They are
+# only requested on the mobile path.
+def _minify_markup(markup: str) -> str:
+    """Strip comments and collapse whitespace in injected HTML/CSS/JS"""
+    markup = re.sub(r"<!--.*?-->|/\*.*?\*/", "", markup, flags=re.S)
+    markup = re.sub(r"^\s*//.*$", "", markup, flags=re.M)
+    return re.sub(r"\s+", " ", markup).strip()
+
+# create_bottom_nav returns "" outside mobile sessions, so the device is part
+# of the cache key; the FAB and swipe script don't depend on the device
+@st.cache_data(show_spinner=False)
+def _bottom_nav_html(is_mobile: bool) -> str:
+    return _minify_markup(get_mobile_nav().create_bottom_nav(list(_NAV_ITEMS)))
+
+@st.cache_data(show_spinner=False)
+def _fab_html() -> str:
+    return _minify_markup(get_mobile_nav().create_floating_action_button("⚡", "Quick Generate", "bottom-right"))
+
+@st.cache_data(show_spinner=False)
+def _swipe_script() -> str:
+    return _minify_markup(MobileGestures.enable_swipe_navigation(['home', 'generate', 'account']))
+
+def _section_heading(title):
+    """Demo section heading, drawn with the section separator above it"""
+    st.markdown(f"<h3 class='demo-section'>{title}</h3>", unsafe_allow_html=True)
+
 def render_mobile_demo():
     """Render mobile optimization demo page"""
     
     # Apply optimizations
     apply_custom_css()
+    st.markdown(_SECTION_CSS, unsafe_allow_html=True)
     mobile_optimizer = apply_global_mobile_optimizations()
     
-    # Get device info
+    # Get device info once and pass it to the sections that need it
     device_info = get_device_info()
-    current_user = get_current_user()
+    # User for the footer; read every run so the session timeout is enforced
+    # and page activity keeps the session alive
+    current_user = get_current_user() or {}
     
     # Page header with responsive layout
     st.title("📱 Mobile Optimization Demo")
@@ -28,26 +183,23 @@ def render_mobile_demo():
     
     # Device information card
     with st.container():
-        st.subheader("🔍 Device Detection")
+        _section_heading("🔍 Device Detection")
         
         cols = st.columns(create_responsive_columns([1], [1, 1], [1, 1, 1]))
         
-        with cols[0]:
-            device_type = "📱 Mobile" if device_info['is_mobile'] else "📱 Tablet" if device_info['is_tablet'] else "🖥️ Desktop"
-            st.metric("Device Type", device_type)
+        device_type = "📱 Mobile" if device_info['is_mobile'] else "📱 Tablet" if device_info['is_tablet'] else "🖥️ Desktop"
+        device_metrics = (
+            ("Device Type", device_type),
+            ("Browser", device_info['browser']),
+            ("Operating System", device_info['os'])
+        )
         
-        if len(cols) > 1:
-            with cols[1]:
-                st.metric("Browser", device_info['browser'])
-        
-        if len(cols) > 2:
-            with cols[2]:
-                st.metric("Operating System", device_info['os'])
-    
-    st.divider()
+        # zip stops at the column count, showing the leading metrics that fit
+        for col, (label, value) in zip(cols, device_metrics):
+            col.metric(label, value)
     
     # Touch Target Demo
-    st.subheader("👆 Touch Target Optimization")
+    _section_heading("👆 Touch Target Optimization")
     st.markdown("All buttons meet WCAG 2.2 accessibility standards with minimum 44px touch targets.")
     
     col1, col2 = st.columns(2)
@@ -68,10 +220,90 @@ def render_mobile_demo():
         if create_mobile_button("Preview", "demo_preview", button_type="secondary", size="medium", icon="👁️"):
             st.info("👁️ Preview opened!")
     
-    st.divider()
-    
     # Form Optimization Demo
-    st.subheader("📝 Mobile-Optimized Forms")
-    st.markdown("Large touch targets and mobile-friendly input methods.")\n    \n    # Create a mobile-optimized form\n    form_fields = [\n        {\n            'type': 'text',\n            'key': 'student_name',\n            'label': 'Student Name',\n            'required': True,\n            'placeholder': 'Enter full name',\n            'help': 'First and last name of the student'\n        },\n        {\n            'type': 'email',\n            'key': 'student_email',\n            'label': 'Email Address',\n            'required': True,\n            'placeholder': 'student@example.com'\n        },\n        {\n            'type': 'select',\n            'key': 'course_name',\n            'label': 'Course Completed',\n            'required': True,\n            'options': ['Workplace Safety', 'Fire Safety', 'First Aid', 'Manual Handling'],\n            'help': 'Select the completed course'\n        },\n        {\n            'type': 'date',\n            'key': 'completion_date',\n            'label': 'Completion Date',\n            'required': True,\n            'help': 'Date when the course was completed'\n        },\n        {\n            'type': 'select',\n            'key': 'result',\n            'label': 'Result',\n            'required': True,\n            'options': ['Pass', 'Fail', 'Distinction'],\n            'default_index': 0\n        }\n    ]\n    \n    form_data = mobile_optimizer.create_mobile_optimized_form(form_fields)\n    \n    if form_data:\n        st.success("🎉 Form submitted successfully!")\n        st.json(form_data)\n    \n    st.divider()\n    \n    # Navigation Demo\n    st.subheader("🧭 Mobile Navigation")\n    \n    if device_info['is_mobile']:\n        st.markdown("**Bottom Navigation Bar** (Mobile Only)")\n        st.markdown("Below you would see a bottom navigation bar with thumb-friendly buttons.")\n        \n        # Demo bottom navigation HTML\n        nav = MobileNavigation()\n        nav_items = [\n            {'key': 'home', 'label': 'Home', 'icon': '🏠', 'active': True},\n            {'key': 'generate', 'label': 'Generate', 'icon': '🏆'},\n            {'key': 'manage', 'label': 'Manage', 'icon': '📋'},\n            {'key': 'account', 'label': 'Account', 'icon': '👤'}\n        ]\n        \n        bottom_nav_html = nav.create_bottom_nav(nav_items)\n        st.markdown(bottom_nav_html, unsafe_allow_html=True)\n        \n        st.markdown("**Floating Action Button**")\n        fab_html = nav.create_floating_action_button("⚡", "Quick Generate", "bottom-right")\n        st.markdown(fab_html, unsafe_allow_html=True)\n        \n    else:\n        st.info("📱 Mobile navigation features are automatically enabled on mobile devices.")\n    \n    st.divider()\n    \n    # Responsive Layout Demo\n    st.subheader("📐 Responsive Layout System")\n    \n    layout_config = mobile_optimizer.get_responsive_layout('dashboard')\n    st.markdown(f"**Current Layout Configuration:** `{layout_config}`")\n    \n    # Demo metrics with responsive columns\n    st.markdown("**Responsive Metrics Grid**")\n    \n    cols = st.columns(create_responsive_columns([1], [1, 1], [1, 1, 1, 1]))\n    \n    metrics_data = [\n        ("Total Certificates", "1,234", "📜"),\n        ("Active Courses", "12", "📚"),\n        ("Students Enrolled", "456", "🎓"),\n        ("Success Rate", "98%", "✅")\n    ]\n    \n    for i, (label, value, icon) in enumerate(metrics_data):\n        if i < len(cols):\n            with cols[i]:\n                st.metric(f"{icon} {label}", value)\n    \n    st.divider()\n    \n    # Accessibility Features\n    st.subheader("♿ Accessibility Features")\n    \n    accessibility_features = [\n        "✅ **WCAG 2.2 Level AA Compliance** - All interactive elements meet accessibility standards",\n        "✅ **44px+ Touch Targets** - Comfortable finger tapping on all buttons",\n        "✅ **High Contrast Colors** - 4.5:1+ contrast ratios for text readability",\n        "✅ **Focus Indicators** - Clear visual focus for keyboard navigation",\n        "✅ **Screen Reader Support** - Proper ARIA labels and semantic HTML",\n        "✅ **Reduced Motion Support** - Respects user's motion preferences",\n        "✅ **Scalable Text** - Works with browser zoom up to 200%"\n    ]\n    \n    for feature in accessibility_features:\n        st.markdown(feature)\n    \n    st.divider()\n    \n    # Performance Information\n    st.subheader("⚡ Performance Optimizations")\n    \n    perf_info = [\n        "🚀 **Mobile-First CSS** - Optimized styles load faster on mobile",\n        "📱 **Touch-Optimized Interactions** - Reduced cognitive load",\n        "🎯 **Progressive Enhancement** - Works without JavaScript",\n        "📊 **Efficient Layouts** - CSS Grid and Flexbox for responsive design",\n        "⚡ **Minimal JavaScript** - Core functionality in Python/Streamlit",\n        "🔧 **Optimized Forms** - Proper input types for mobile keyboards"\n    ]\n    \n    for info in perf_info:\n        st.markdown(info)\n    \n    # User feedback section\n    st.divider()\n    st.subheader("💬 User Experience Feedback")\n    \n    col1, col2 = st.columns(2)\n    \n    with col1:\n        if create_mobile_button("👍 Great Experience", "feedback_good", button_type="success", size="medium"):\n            st.balloons()\n            st.success("Thank you for your feedback!")\n    \n    with col2:\n        if create_mobile_button("👎 Needs Improvement", "feedback_bad", button_type="warning", size="medium"):\n            st.info("We appreciate your feedback and are working to improve!")\n    \n    # Footer with app info\n    st.divider()\n    st.caption(f"SafeSteps Mobile-Optimized | User: {current_user.get('username', 'Unknown')} | Device: {device_info['device']}")\n    \n    # Add gesture instructions for mobile\n    if device_info['is_mobile']:\n        st.info("💡 **Mobile Tip:** Swipe left/right to navigate between pages, pull down to refresh!")\n        \n        # Enable swipe gestures\n        from utils.mobile_optimization import MobileGestures\n        gestures = MobileGestures()\n        swipe_script = gestures.enable_swipe_navigation(['home', 'generate', 'account'])\n        st.markdown(swipe_script, unsafe_allow_html=True)
+    _section_heading("📝 Mobile-Optimized Forms")
+    st.markdown("Large touch targets and mobile-friendly input methods.")
+    
+    form_data = mobile_optimizer.create_mobile_optimized_form(_FORM_FIELDS)
+    
+    if form_data:
+        st.success("🎉 Form submitted successfully!")
+        st.json(form_data)
+    
+    # Navigation Demo
+    _section_heading("🧭 Mobile Navigation")
+    
+    if device_info['is_mobile']:
+        _render_mobile_navigation(device_info)
+    else:
+        _render_desktop_navigation_info()
+    
+    # Responsive Layout Demo
+    _section_heading("📐 Responsive Layout System")
+    
+    layout_config = mobile_optimizer.get_responsive_layout('dashboard')
+    st.markdown("**Current Layout Configuration:**")
+    st.code(str(layout_config), language=None)
+    
+    # Metrics grid, accessibility features and performance information
+    st.html(_STATIC_SECTIONS_HTML)
+    
+    # User feedback section
+    _feedback_section()
+    
+    # Footer with app info
+    footer = f"SafeSteps Mobile-Optimized | User: {current_user.get('username', 'Unknown')} | Device: {device_info['device']}"
+    st.markdown(f"<p class='demo-section demo-footer'>{html.escape(footer)}</p>", unsafe_allow_html=True)
+    
+    # Add gesture instructions for mobile
+    if device_info['is_mobile']:
+        _mobile_gestures_section()
+
+def _render_mobile_navigation(device_info):
+    """Bottom navigation and floating action button demo (mobile only)"""
+    st.markdown("**Bottom Navigation Bar** (Mobile Only)")
+    st.markdown("Below you would see a bottom navigation bar with thumb-friendly buttons.")
+    
+    # Demo bottom navigation HTML
+    st.markdown(_bottom_nav_html(device_info['is_mobile']), unsafe_allow_html=True)
+    
+    st.markdown("**Floating Action Button**")
+    st.markdown(_fab_html(), unsafe_allow_html=True)
+
+def _render_desktop_navigation_info():
+    """Note shown in place of the mobile navigation demo"""
+    st.info("📱 Mobile navigation features are automatically enabled on mobile devices.")
+
+@st.fragment
+def _feedback_section():
+    """Feedback buttons, rerun on their own without the rest of the demo"""
+    _section_heading("💬 User Experience Feedback")
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        if create_mobile_button("👍 Great Experience", "feedback_good", button_type="success", size="medium"):
+            # Celebrate once; repeated clicks just thank the user
+            if not st.session_state.get('balloons_shown'):
+                st.balloons()
+                st.session_state['balloons_shown'] = True
+            st.success("Thank you for your feedback!")
+    
+    with col2:
+        if create_mobile_button("👎 Needs Improvement", "feedback_bad", button_type="warning", size="medium"):
+            st.session_state['balloons_shown'] = False
+            st.info("We appreciate your feedback and are working to improve!")
+
+@st.fragment
+def _mobile_gestures_section():
+    """Mobile tip and swipe gesture script"""
+    st.info("💡 **Mobile Tip:** Swipe left/right to navigate between pages, pull down to refresh!")
+    
+    # Enable swipe gestures
+    st.markdown(_swipe_script(), unsafe_allow_html=True)
 
-if __name__ == "__main__":\n    render_mobile_demo()
\ No newline at end of file
+# app.py's st.navigation menu doesn't register this page, so it is only
+# reached with `streamlit run pages/mobile_demo.py`; the guard also lets the
+# module be imported (e.g. by tests) without rendering
+if __name__ == "__main__":
+    render_mobile_demo()
\ No newline at end of file
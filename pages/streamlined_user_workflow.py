@@ -6,9 +6,12 @@ Built with enhanced UI components and touch-friendly interfaces
 
 import streamlit as st
 import pandas as pd
+import io
+import os
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple
 from pathlib import Path
 
 # Import SafeSteps modules
@@ -29,6 +32,155 @@ from utils.file_processing import SpreadsheetValidator
 from utils.certificate_generation import CertificateGenerator
 from data.course_manager import CourseManager
 
+@st.cache_resource
+def _get_course_manager():
+    """Shared CourseManager, built once per process"""
+    return CourseManager()
+
+@st.cache_resource
+def _get_validator():
+    """Shared SpreadsheetValidator, built once per process"""
+    return SpreadsheetValidator()
+
+@st.cache_resource
+def _get_generator():
+    """Shared CertificateGenerator, built once per process"""
+    return CertificateGenerator()
+
+@st.cache_data(ttl=300)
+def _get_courses():
+    """Available course templates, refreshed every 5 minutes"""
+    return _get_course_manager().get_available_courses()
+
+@st.cache_data(ttl=300)
+def _get_course_map():
+    """Course templates keyed by name"""
+    return {course['name']: course for course in _get_courses()}
+
+@st.cache_data(ttl=30, show_spinner=False)
+def _cached_suggestions(user_id: str) -> Dict:
+    """Smart suggestions for a user, shared across reruns"""
+    return get_user_suggestions(user_id)
+
+@st.cache_data(ttl=30, show_spinner=False)
+def _cached_recent_workflows(user_id: str) -> List[Dict]:
+    """Saved workflows for a user, shared across reruns"""
+    from utils.workflow_engine import list_user_workflows
+    return list_user_workflows(user_id)
+
+@st.cache_data(show_spinner="Parsing file...", max_entries=8)
+def _preview_df(file_bytes: bytes, name: str) -> Tuple[pd.DataFrame, int]:
+    """First 50 rows of an uploaded sheet plus its total row count, keyed on the file bytes"""
+    buffer = io.BytesIO(file_bytes)
+    if name.endswith('.csv'):
+        df = pd.read_csv(buffer)
+    else:
+        df = pd.read_excel(buffer)
+    return df.head(50), len(df)
+
+def _clear_workflow_caches():
+    """Drop cached suggestions and workflow lists after a workflow changes"""
+    _cached_suggestions.clear()
+    _cached_recent_workflows.clear()
+
+# Static header and card markup. COLORS/TYPOGRAPHY don't change at runtime,
+# so the interpolation is done once here rather than on every rerun
+_SELECTION_HEADER_HTML = f"""
+<div style="
+    text-align: center;
+    padding: 2rem 1rem;
+    background: linear-gradient(135deg, {COLORS['primary']} 0%, {COLORS['primary_light']} 100%);
+    color: white;
+    border-radius: 1rem;
+    margin-bottom: 2rem;
+">
+    <h1 style="margin: 0; font-size: {TYPOGRAPHY['h1']['size']}; font-weight: {TYPOGRAPHY['h1']['weight']};">🎓 SafeSteps</h1>
+    <p style="margin: 0.5rem 0 0 0; font-size: {TYPOGRAPHY['body_large']['size']}; opacity: 0.9;">Certificate Generation Made Simple</p>
+</div>
+"""
+
+_QUICK_CARD_HTML = f"""
+<div style="text-align: center; padding: 1rem;">
+    <div style="font-size: 3rem; margin-bottom: 1rem;">⚡</div>
+    <h3 style="color: {COLORS['primary']}; margin: 0.5rem 0;">Quick Generate</h3>
+    <p style="color: {COLORS['text_secondary']}; margin-bottom: 1.5rem;">Fast certificate generation with smart defaults. Perfect for recurring tasks.</p>
+</div>
+"""
+
+_GUIDED_CARD_HTML = f"""
+<div style="text-align: center; padding: 1rem;">
+    <div style="font-size: 3rem; margin-bottom: 1rem;">🎯</div>
+    <h3 style="color: {COLORS['primary']}; margin: 0.5rem 0;">Guided Mode</h3>
+    <p style="color: {COLORS['text_secondary']}; margin-bottom: 1.5rem;">Step-by-step guidance with help text and validation. Ideal for new users.</p>
+</div>
+"""
+
+_ADVANCED_CARD_HTML = f"""
+<div style="text-align: center; padding: 1rem;">
+    <div style="font-size: 3rem; margin-bottom: 1rem;">🔧</div>
+    <h3 style="color: {COLORS['primary']}; margin: 0.5rem 0;">Advanced Mode</h3>
+    <p style="color: {COLORS['text_secondary']}; margin-bottom: 1.5rem;">Full customization and control. For power users who need all options.</p>
+</div>
+"""
+
+_QUICK_HEADER_HTML = f"""
+<div style="
+    background: linear-gradient(135deg, {COLORS['success']} 0%, {COLORS['accent']} 100%);
+    color: white;
+    padding: 1.5rem;
+    border-radius: 1rem;
+    margin-bottom: 2rem;
+    text-align: center;
+">
+    <h2 style="margin: 0; display: flex; align-items: center; justify-content: center; gap: 0.5rem;">
+        ⚡ Quick Generate Mode
+    </h2>
+    <p style="margin: 0.5rem 0 0 0; opacity: 0.9;">Complete all steps on one page with smart defaults</p>
+</div>
+"""
+
+_GUIDED_HEADER_HTML = f"""
+<div style="
+    background: linear-gradient(135deg, {COLORS['primary']} 0%, {COLORS['info']} 100%);
+    color: white;
+    padding: 1.5rem;
+    border-radius: 1rem;
+    margin-bottom: 2rem;
+    text-align: center;
+">
+    <h2 style="margin: 0; display: flex; align-items: center; justify-content: center; gap: 0.5rem;">
+        🎯 Guided Mode
+    </h2>
+    <p style="margin: 0.5rem 0 0 0; opacity: 0.9;">Step-by-step guidance with help and validation</p>
+</div>
+"""
+
+_ADVANCED_HEADER_HTML = f"""
+<div style="
+    background: linear-gradient(135deg, {COLORS['text_primary']} 0%, {COLORS['primary_dark']} 100%);
+    color: white;
+    padding: 1.5rem;
+    border-radius: 1rem;
+    margin-bottom: 2rem;
+    text-align: center;
+">
+    <h2 style="margin: 0; display: flex; align-items: center; justify-content: center; gap: 0.5rem;">
+        🔧 Advanced Mode
+    </h2>
+    <p style="margin: 0.5rem 0 0 0; opacity: 0.9;">Full customization and power user features</p>
+</div>
+"""
+
+_COMPLETION_HTML = f"""
+<div style="text-align: center; padding: 2rem;">
+    <div style="font-size: 4rem; margin-bottom: 1rem;">🎉</div>
+    <h2 style="color: {COLORS['success']}; margin: 0.5rem 0;">Workflow Completed!</h2>
+    <p style="color: {COLORS['text_secondary']};">Your certificates have been generated successfully.</p>
+</div>
+"""
+
+_GUIDED_STEPS = ('upload', 'validate', 'course_select', 'preview', 'generate')
+
 def streamlined_workflow_page():
     """Main entry point for streamlined user workflow"""
     # Apply custom CSS for mobile-first design
@@ -62,22 +214,10 @@ def streamlined_workflow_page():
 def render_workflow_mode_selection(user_id: str):
     """Render workflow mode selection with smart suggestions"""
     # Header with mobile-friendly design
-    st.markdown(f"""
-    <div style="
-        text-align: center;
-        padding: 2rem 1rem;
-        background: linear-gradient(135deg, {COLORS['primary']} 0%, {COLORS['primary_light']} 100%);
-        color: white;
-        border-radius: 1rem;
-        margin-bottom: 2rem;
-    ">
-        <h1 style="margin: 0; font-size: {TYPOGRAPHY['h1']['size']}; font-weight: {TYPOGRAPHY['h1']['weight']};">🎓 SafeSteps</h1>
-        <p style="margin: 0.5rem 0 0 0; font-size: {TYPOGRAPHY['body_large']['size']}; opacity: 0.9;">Certificate Generation Made Simple</p>
-    </div>
-    """, unsafe_allow_html=True)
+    st.markdown(_SELECTION_HEADER_HTML, unsafe_allow_html=True)
     
     # Get smart suggestions based on user behavior
-    suggestions = get_user_suggestions(user_id)
+    suggestions = _cached_suggestions(user_id)
     
     # Show suggested mode if available
     if suggestions.get('preferred_mode'):
@@ -92,13 +232,7 @@ def render_workflow_mode_selection(user_id: str):
     # Quick Generate Mode
     with (col1 if not _is_mobile_viewport() else st.container()):
         with st.container(border=True):
-            st.markdown(f"""
-            <div style="text-align: center; padding: 1rem;">
-                <div style="font-size: 3rem; margin-bottom: 1rem;">⚡</div>
-                <h3 style="color: {COLORS['primary']}; margin: 0.5rem 0;">Quick Generate</h3>
-                <p style="color: {COLORS['text_secondary']}; margin-bottom: 1.5rem;">Fast certificate generation with smart defaults. Perfect for recurring tasks.</p>
-            </div>
-            """, unsafe_allow_html=True)
+            st.markdown(_QUICK_CARD_HTML, unsafe_allow_html=True)
             
             if create_prominent_button(
                 "Start Quick Generate",
@@ -113,13 +247,7 @@ def render_workflow_mode_selection(user_id: str):
     # Guided Mode
     with (col2 if not _is_mobile_viewport() else st.container()):
         with st.container(border=True):
-            st.markdown(f"""
-            <div style="text-align: center; padding: 1rem;">
-                <div style="font-size: 3rem; margin-bottom: 1rem;">🎯</div>
-                <h3 style="color: {COLORS['primary']}; margin: 0.5rem 0;">Guided Mode</h3>
-                <p style="color: {COLORS['text_secondary']}; margin-bottom: 1.5rem;">Step-by-step guidance with help text and validation. Ideal for new users.</p>
-            </div>
-            """, unsafe_allow_html=True)
+            st.markdown(_GUIDED_CARD_HTML, unsafe_allow_html=True)
             
             if create_prominent_button(
                 "Start Guided Mode",
@@ -134,13 +262,7 @@ def render_workflow_mode_selection(user_id: str):
     # Advanced Mode
     with (col3 if not _is_mobile_viewport() else st.container()):
         with st.container(border=True):
-            st.markdown(f"""
-            <div style="text-align: center; padding: 1rem;">
-                <div style="font-size: 3rem; margin-bottom: 1rem;">🔧</div>
-                <h3 style="color: {COLORS['primary']}; margin: 0.5rem 0;">Advanced Mode</h3>
-                <p style="color: {COLORS['text_secondary']}; margin-bottom: 1.5rem;">Full customization and control. For power users who need all options.</p>
-            </div>
-            """, unsafe_allow_html=True)
+            st.markdown(_ADVANCED_CARD_HTML, unsafe_allow_html=True)
             
             if create_prominent_button(
                 "Start Advanced Mode",
@@ -161,6 +283,7 @@ def render_workflow_mode_selection(user_id: str):
 def start_workflow(user_id: str, mode: WorkflowMode):
     """Start a new workflow with the selected mode"""
     workflow_id = create_workflow(user_id, mode.value)
+    _clear_workflow_caches()
     st.session_state.workflow_id = workflow_id
     st.session_state.resumed_workflow = False
     st.rerun()
@@ -176,37 +299,42 @@ def render_active_workflow():
         st.rerun()
         return
     
-    mode = WorkflowMode(workflow_state['mode'])
     progress = get_workflow_progress(workflow_id)
     
     # Render mode-specific interface
-    if mode == WorkflowMode.QUICK_GENERATE:
-        render_quick_mode(workflow_id, workflow_state, progress)
-    elif mode == WorkflowMode.GUIDED_MODE:
-        render_guided_mode(workflow_id, workflow_state, progress)
-    elif mode == WorkflowMode.ADVANCED_MODE:
-        render_advanced_mode(workflow_id, workflow_state, progress)
+    renderer = _MODE_RENDERERS.get(workflow_state['mode'])
+    if renderer:
+        renderer(workflow_id, workflow_state, progress)
 
 def render_quick_mode(workflow_id: str, workflow_state: Dict, progress: Dict):
     """Render Quick Generate mode - all steps on one page"""
-    st.markdown(f"""
-    <div style="
-        background: linear-gradient(135deg, {COLORS['success']} 0%, {COLORS['accent']} 100%);
-        color: white;
-        padding: 1.5rem;
-        border-radius: 1rem;
-        margin-bottom: 2rem;
-        text-align: center;
-    ">
-        <h2 style="margin: 0; display: flex; align-items: center; justify-content: center; gap: 0.5rem;">
-            ⚡ Quick Generate Mode
-        </h2>
-        <p style="margin: 0.5rem 0 0 0; opacity: 0.9;">Complete all steps on one page with smart defaults</p>
-    </div>
-    """, unsafe_allow_html=True)
-    
-    # Progress indicator
-    render_workflow_progress(progress)
+    st.markdown(_QUICK_HEADER_HTML, unsafe_allow_html=True)
+    
+    _quick_form(workflow_id, workflow_state['user_id'])
+    
+    # Workflow actions
+    render_workflow_actions(workflow_id)
+
+@st.fragment
+def _quick_form(workflow_id: str, user_id: str):
+    """Progress and quick generate form, rerun on their own so other widgets don't rebuild them
+    
+    Course options and progress are read here on every fragment run, since
+    fragment reruns reuse the arguments from the last full run.
+    """
+    # Progress indicator, filled in after any generation below has advanced the workflow
+    progress_slot = st.empty()
+    
+    # Course options with smart default: most recently used course
+    course_options = [course['name'] for course in _get_courses()]
+    default_course = None
+    suggestions = _cached_suggestions(user_id)
+    if suggestions.get('quick_templates'):
+        default_course = suggestions['quick_templates'][0]
+    
+    default_index = 0
+    if default_course and default_course in course_options:
+        default_index = course_options.index(default_course)
     
     # All steps in one interface with smart defaults
     with st.form("quick_generate_form", clear_on_submit=False):
@@ -220,20 +348,6 @@ def render_quick_mode(workflow_id: str, workflow_state: Dict, progress: Dict):
         
         # Step 2: Course Selection (with smart defaults)
         st.markdown("### 🎓 Step 2: Select Course Template")
-        course_manager = CourseManager()
-        courses = course_manager.get_available_courses()
-        
-        # Smart default: most recently used course
-        default_course = None
-        suggestions = get_user_suggestions(workflow_state['user_id'])
-        if suggestions.get('quick_templates'):
-            default_course = suggestions['quick_templates'][0]
-        
-        course_options = [course['name'] for course in courses]
-        default_index = 0
-        if default_course and default_course in course_options:
-            default_index = course_options.index(default_course)
-        
         selected_course = st.selectbox(
             "Course Template",
             course_options,
@@ -263,37 +377,24 @@ def render_quick_mode(workflow_id: str, workflow_state: Dict, progress: Dict):
                 type="primary",
                 use_container_width=True
             )
-        
-        if submitted and uploaded_file:
-            process_quick_generation(
-                workflow_id=workflow_id,
-                uploaded_file=uploaded_file,
-                selected_course=selected_course,
-                send_emails=send_emails,
-                include_qr=include_qr,
-                batch_size=batch_size
-            )
     
-    # Workflow actions
-    render_workflow_actions(workflow_id)
+    # Outside the form: the results include a download button
+    if submitted and uploaded_file:
+        process_quick_generation(
+            workflow_id=workflow_id,
+            uploaded_file=uploaded_file,
+            selected_course=selected_course,
+            send_emails=send_emails,
+            include_qr=include_qr,
+            batch_size=batch_size
+        )
+    
+    with progress_slot.container():
+        render_workflow_progress(get_workflow_progress(workflow_id))
 
 def render_guided_mode(workflow_id: str, workflow_state: Dict, progress: Dict):
     """Render Guided mode - step by step with help and validation"""
-    st.markdown(f"""
-    <div style="
-        background: linear-gradient(135deg, {COLORS['primary']} 0%, {COLORS['info']} 100%);
-        color: white;
-        padding: 1.5rem;
-        border-radius: 1rem;
-        margin-bottom: 2rem;
-        text-align: center;
-    ">
-        <h2 style="margin: 0; display: flex; align-items: center; justify-content: center; gap: 0.5rem;">
-            🎯 Guided Mode
-        </h2>
-        <p style="margin: 0.5rem 0 0 0; opacity: 0.9;">Step-by-step guidance with help and validation</p>
-    </div>
-    """, unsafe_allow_html=True)
+    st.markdown(_GUIDED_HEADER_HTML, unsafe_allow_html=True)
     
     # Progress with step navigation
     render_workflow_progress(progress)
@@ -301,37 +402,17 @@ def render_guided_mode(workflow_id: str, workflow_state: Dict, progress: Dict):
     
     current_step = workflow_state.get('current_step')
     
-    if current_step == 'upload':
-        render_guided_upload_step(workflow_id, workflow_state)
-    elif current_step == 'validate':
-        render_guided_validate_step(workflow_id, workflow_state)
-    elif current_step == 'course_select':
-        render_guided_course_step(workflow_id, workflow_state)
-    elif current_step == 'preview':
-        render_guided_preview_step(workflow_id, workflow_state)
-    elif current_step == 'generate':
-        render_guided_generate_step(workflow_id, workflow_state)
+    if current_step in _GUIDED_STEP_RENDERERS:
+        _GUIDED_STEP_RENDERERS[current_step](workflow_id, workflow_state)
+    elif current_step in _GUIDED_STEPS:
+        st.warning(f"The {current_step.replace('_', ' ')} step isn't available in guided mode yet.")
     else:
         st.success("🎉 Workflow completed! Check your downloads.")
         render_workflow_completion(workflow_id, workflow_state)
 
 def render_advanced_mode(workflow_id: str, workflow_state: Dict, progress: Dict):
     """Render Advanced mode - full control with all options"""
-    st.markdown(f"""
-    <div style="
-        background: linear-gradient(135deg, {COLORS['text_primary']} 0%, {COLORS['primary_dark']} 100%);
-        color: white;
-        padding: 1.5rem;
-        border-radius: 1rem;
-        margin-bottom: 2rem;
-        text-align: center;
-    ">
-        <h2 style="margin: 0; display: flex; align-items: center; justify-content: center; gap: 0.5rem;">
-            🔧 Advanced Mode
-        </h2>
-        <p style="margin: 0.5rem 0 0 0; opacity: 0.9;">Full customization and power user features</p>
-    </div>
-    """, unsafe_allow_html=True)
+    st.markdown(_ADVANCED_HEADER_HTML, unsafe_allow_html=True)
     
     # Tabbed interface for advanced users
     tab1, tab2, tab3, tab4 = st.tabs(["📁 Data", "🎓 Templates", "⚙️ Options", "🚀 Generate"])
@@ -376,13 +457,10 @@ def render_guided_upload_step(workflow_id: str, workflow_state: Dict):
             # Preview file contents
             with st.expander("📊 Preview File Contents", expanded=True):
                 try:
-                    if uploaded_file.name.endswith('.csv'):
-                        df = pd.read_csv(uploaded_file)
-                    else:
-                        df = pd.read_excel(uploaded_file)
+                    df, total_rows = _preview_df(uploaded_file.getvalue(), uploaded_file.name)
                     
                     st.dataframe(df.head(10), use_container_width=True)
-                    st.caption(f"Showing first 10 rows of {len(df)} total rows")
+                    st.caption(f"Showing first 10 rows of {total_rows} total rows")
                     
                     # Column analysis
                     st.markdown("**Detected Columns:**")
@@ -455,7 +533,7 @@ def render_workflow_progress(progress: Dict):
 
 def render_step_navigation(workflow_id: str, workflow_state: Dict, progress: Dict):
     """Render step navigation with jump capabilities"""
-    steps = ['upload', 'validate', 'course_select', 'preview', 'generate']
+    steps = _GUIDED_STEPS
     current_step = workflow_state.get('current_step')
     step_statuses = workflow_state.get('step_statuses', {})
     
@@ -540,9 +618,7 @@ def render_workflow_actions(workflow_id: str):
 
 def render_recent_workflows_section(user_id: str):
     """Render recent workflows section"""
-    from utils.workflow_engine import list_user_workflows
-    
-    recent_workflows = list_user_workflows(user_id)
+    recent_workflows = _cached_recent_workflows(user_id)
     
     if recent_workflows:
         st.markdown("### 📋 Recent Workflows")
@@ -575,7 +651,7 @@ def process_quick_generation(workflow_id: str, uploaded_file, selected_course: s
         with progress_container.container():
             st.info("🔍 Validating uploaded data...")
             
-        validator = SpreadsheetValidator()
+        validator = _get_validator()
         validation_result = validator.validate_file(uploaded_file)
         
         if not validation_result.valid:
@@ -586,9 +662,8 @@ def process_quick_generation(workflow_id: str, uploaded_file, selected_course: s
         with progress_container.container():
             st.info("⚙️ Initializing certificate generator...")
             
-        generator = CertificateGenerator()
-        course_manager = CourseManager()
-        template = course_manager.get_course_by_name(selected_course)
+        generator = _get_generator()
+        template = _get_course_map().get(selected_course)
         
         # Step 3: Generate certificates
         with progress_container.container():
@@ -597,34 +672,54 @@ def process_quick_generation(workflow_id: str, uploaded_file, selected_course: s
         # Create progress bar for generation
         progress_bar = st.progress(0)
         
-        generated_files = []
-        total_rows = len(validation_result.cleaned_data)
-        
-        for i, (_, row) in enumerate(validation_result.cleaned_data.iterrows()):
-            # Generate individual certificate
-            cert_data = {
-                'name': row.get('name', row.get('Name', '')),
-                'email': row.get('email', row.get('Email', '')),
-                'course': selected_course,
-                'date': datetime.now().strftime('%Y-%m-%d'),
-                'include_qr': include_qr
-            }
-            
-            try:
-                cert_file = generator.generate_certificate(cert_data, template)
-                generated_files.append(cert_file)
-                
-                # Update progress
-                progress = (i + 1) / total_rows
-                progress_bar.progress(progress)
+        # Normalise the name/email headers once so each row is a plain lookup;
+        # an existing lowercase column wins over its capitalised variant
+        df = validation_result.cleaned_data
+        df = df.rename(columns={c: c.lower() for c in df.columns if c.lower() not in df.columns})
+        df = df.loc[:, ~df.columns.duplicated()].reindex(columns=['name', 'email'], fill_value='')
+        records = df.to_dict(orient='records')
+        total_rows = len(records)
+        generation_date = datetime.now().strftime('%Y-%m-%d')
+        
+        # Rows are independent, so render them in parallel, batch_size at a time;
+        # results are slotted back by row index to keep the package in input order
+        results = {}
+        completed = 0
+        max_workers = min(os.cpu_count() or 1, 8)
+        
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            for start in range(0, total_rows, batch_size):
+                future_to_row = {}
+                for i, row in enumerate(records[start:start + batch_size], start):
+                    cert_data = {
+                        'name': row['name'],
+                        'email': row['email'],
+                        'course': selected_course,
+                        'date': generation_date,
+                        'include_qr': include_qr
+                    }
+                    future = executor.submit(generator.generate_certificate, cert_data, template)
+                    future_to_row[future] = (i, cert_data)
                 
-                # Send email if requested
-                if send_emails and cert_data.get('email'):
-                    # Email sending logic would go here
-                    pass
+                for future in as_completed(future_to_row):
+                    i, cert_data = future_to_row[future]
+                    completed += 1
+                    
+                    try:
+                        results[i] = future.result()
+                        
+                        # Send email if requested
+                        if send_emails and cert_data.get('email'):
+                            # Email sending logic would go here
+                            pass
+                            
+                    except Exception as e:
+                        st.warning(f"Failed to generate certificate for {cert_data['name']}: {str(e)}")
                     
-            except Exception as e:
-                st.warning(f"Failed to generate certificate for {cert_data['name']}: {str(e)}")
+                    # Update progress
+                    progress_bar.progress(completed / total_rows)
+        
+        generated_files = [results[i] for i in sorted(results)]
         
         # Step 4: Package results
         with progress_container.container():
@@ -653,6 +748,7 @@ def process_quick_generation(workflow_id: str, uploaded_file, selected_course: s
             'generated_count': len(generated_files),
             'completion_time': datetime.now().isoformat()
         })
+        _clear_workflow_caches()
         
     except Exception as e:
         st.error(f"❌ Generation failed: {str(e)}")
@@ -690,13 +786,7 @@ def render_workflow_completion(workflow_id: str, workflow_state: Dict):
     st.balloons()
     
     with st.container(border=True):
-        st.markdown(f"""
-        <div style="text-align: center; padding: 2rem;">
-            <div style="font-size: 4rem; margin-bottom: 1rem;">🎉</div>
-            <h2 style="color: {COLORS['success']}; margin: 0.5rem 0;">Workflow Completed!</h2>
-            <p style="color: {COLORS['text_secondary']};">Your certificates have been generated successfully.</p>
-        </div>
-        """, unsafe_allow_html=True)
+        st.markdown(_COMPLETION_HTML, unsafe_allow_html=True)
     
     # Show completion stats
     completion_data = workflow_state.get('step_data', {}).get('generate', {})
@@ -776,8 +866,7 @@ def render_advanced_template_tab(workflow_id: str, workflow_state: Dict):
     st.markdown("### 🎨 Advanced Template Customization")
     
     # Template selection with preview
-    course_manager = CourseManager()
-    courses = course_manager.get_available_courses()
+    courses = _get_courses()
     
     selected_course = st.selectbox(
         "Base Template",
@@ -897,5 +986,17 @@ def render_advanced_generate_tab(workflow_id: str, workflow_state: Dict):
     else:
         st.warning("⚠️ Please complete all checklist items before generating")
 
+# Dispatch tables, keyed on the stored mode value and guided step id.
+# Guided steps without a renderer in this page are left out of the table.
+_MODE_RENDERERS = {
+    WorkflowMode.QUICK_GENERATE.value: render_quick_mode,
+    WorkflowMode.GUIDED_MODE.value: render_guided_mode,
+    WorkflowMode.ADVANCED_MODE.value: render_advanced_mode
+}
+
+_GUIDED_STEP_RENDERERS = {
+    'upload': render_guided_upload_step
+}
+
 if __name__ == "__main__":
     streamlined_workflow_page()
@@ -0,0 +1,54 @@
+"""
+Tests for the guided dashboard's pre-rendered help markdown
+
+The help text is written for st.markdown (CommonMark) but pre-rendered
+with Python-Markdown, which only starts a list after a blank line.
+These tests check that the lists still come out as real HTML lists.
+"""
+import importlib.util
+import sys
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("markdown")
+
+# Ensure we're testing from the right directory
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+
+@pytest.fixture(scope="module")
+def guided_dashboard():
+    """The guided dashboard page loaded as a module"""
+    page_path = ROOT / "pages" / "dashboard_v2_guided.py"
+    spec = importlib.util.spec_from_file_location("pages_dashboard_v2_guided", page_path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def test_tutorial_lists_render_as_html_lists(guided_dashboard):
+    """Test that the welcome tutorial's bullet list is pre-rendered as <ul>"""
+    welcome_html = guided_dashboard._markdown_to_html(guided_dashboard._TUTORIAL_STEPS[0]["content"])
+    assert "<ul>" in welcome_html
+    assert "<li>Generate certificates for students</li>" in welcome_html
+
+
+def test_help_modal_lists_render_as_html_lists(guided_dashboard):
+    """Test that the certificate and user help bodies keep their numbered and bullet lists"""
+    for body in (guided_dashboard._CERTIFICATE_HELP_MD, guided_dashboard._USER_HELP_MD):
+        body_html = guided_dashboard._markdown_to_html(body)
+        assert "<ol>" in body_html
+        assert "<ul>" in body_html
+        assert "<p>1." not in body_html
+
+
+def test_sidebar_help_lists_render_as_html_lists(guided_dashboard):
+    """Test that each sidebar help section keeps its lists"""
+    dashboard_html = guided_dashboard._markdown_to_html(guided_dashboard._SIDEBAR_HELP['dashboard']['content'])
+    assert "<ul>" in dashboard_html
+    
+    certificates_html = guided_dashboard._markdown_to_html(guided_dashboard._SIDEBAR_HELP['certificates']['content'])
+    assert "<ol>" in certificates_html
+    assert "<ul>" in certificates_html
@@ -0,0 +1,38 @@
+"""
+Import smoke test for the Streamlit pages
+
+Each page that guards its entry point with ``if __name__ == "__main__"``
+is executed as a plain module import, so module-level constants that
+reference names defined later in the file (or any other import-time
+error) fail here instead of when the page is first opened.
+"""
+import importlib.util
+import sys
+from pathlib import Path
+
+import pytest
+
+# Ensure we're testing from the right directory
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+# Pages that already import helpers missing from this tree
+KNOWN_BROKEN = {
+    "streamlined_user_workflow.py": "imports ui_components helpers, data.course_manager and config.auth that do not exist",
+    "user_workflow.py": "imports data.course_manager, which does not exist",
+}
+
+PAGES = [
+    pytest.param(path, id=path.name, marks=pytest.mark.xfail(reason=KNOWN_BROKEN[path.name], strict=True))
+    if path.name in KNOWN_BROKEN else pytest.param(path, id=path.name)
+    for path in sorted((ROOT / "pages").glob("*.py"))
+    if 'if __name__ == "__main__":' in path.read_text(encoding="utf-8")
+]
+
+
+@pytest.mark.parametrize("page_path", PAGES)
+def test_page_imports(page_path):
+    """Test that the page module executes at import time without errors"""
+    spec = importlib.util.spec_from_file_location(f"pages_smoke_{page_path.stem}", page_path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
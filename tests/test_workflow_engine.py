@@ -0,0 +1,74 @@
+"""
+Unit tests for the workflow engine's step delta log
+"""
+import pytest
+from unittest.mock import patch
+
+from utils.workflow_engine import FlexibleWorkflowEngine, WorkflowMode, StepStatus
+
+
+class TestWorkflowDeltaLog:
+    """Test that step completions logged between snapshots survive a reload"""
+
+    @pytest.fixture
+    def engine_factory(self, tmp_path):
+        """Build engines that share one temporary storage directory"""
+        def factory():
+            with patch('utils.workflow_engine.Path.home', return_value=tmp_path):
+                return FlexibleWorkflowEngine()
+        return factory
+
+    @pytest.fixture
+    def engine(self, engine_factory):
+        return engine_factory()
+
+    @pytest.fixture
+    def workflow_id(self, engine):
+        """Guided workflow whose initial snapshot is already on disk"""
+        workflow_id = engine.create_workflow('test_user', WorkflowMode.GUIDED_MODE)
+        assert (engine.storage_dir / f"workflow_{workflow_id}.json").exists()
+        return workflow_id
+
+    def test_completion_after_snapshot_is_replayed(self, engine, engine_factory, workflow_id):
+        """Test that a step logged after the snapshot is applied on load"""
+        engine.advance_step(workflow_id, 'upload', {'filename': 'students.csv'})
+        assert engine._delta_path(workflow_id).exists()
+
+        workflow = engine_factory().get_workflow(workflow_id)
+
+        assert workflow.step_statuses['upload'] == StepStatus.COMPLETED
+        assert workflow.step_data['upload'] == {'filename': 'students.csv'}
+        assert workflow.current_step == engine.workflows[workflow_id].current_step
+        assert workflow.step_statuses[workflow.current_step] == StepStatus.ACTIVE
+
+    def test_save_workflow_truncates_log(self, engine, engine_factory, workflow_id):
+        """Test that a full snapshot replaces the logged steps"""
+        engine.advance_step(workflow_id, 'upload', {'filename': 'students.csv'})
+
+        assert engine.save_workflow(workflow_id)
+        assert not engine._delta_path(workflow_id).exists()
+
+        workflow = engine_factory().get_workflow(workflow_id)
+        assert workflow.step_statuses['upload'] == StepStatus.COMPLETED
+        assert workflow.step_data['upload'] == {'filename': 'students.csv'}
+
+    def test_corrupt_line_does_not_break_loading(self, engine, engine_factory, workflow_id):
+        """Test that unreadable records are skipped and the rest are replayed"""
+        engine.advance_step(workflow_id, 'upload', {'filename': 'students.csv'})
+        with open(engine._delta_path(workflow_id), 'a') as f:
+            f.write('{"step": "validate", "da\n')
+            f.write('{"data": null}\n')
+        engine.advance_step(workflow_id, 'validate', {'valid_rows': 10})
+
+        workflow = engine_factory().get_workflow(workflow_id)
+
+        assert workflow is not None
+        assert workflow.step_statuses['upload'] == StepStatus.COMPLETED
+        assert workflow.step_statuses['validate'] == StepStatus.COMPLETED
+        assert workflow.step_data['validate'] == {'valid_rows': 10}
+
+    def test_append_failure_returns_false(self, engine, workflow_id):
+        """Test that a failed append is reported without raising"""
+        engine.storage_dir = engine.storage_dir / 'missing'
+
+        assert engine._append_step_delta(workflow_id, 'upload', None, engine.workflows[workflow_id].updated_at) is False
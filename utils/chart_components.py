@@ -4,7 +4,7 @@ Provides visual charts and graphs for the modern dashboard
 """
 import streamlit as st
 import pandas as pd
-import random
+import numpy as np
 
 def create_mini_chart(title, values, labels):
     """Create a simple mini chart using Streamlit native components"""
@@ -35,31 +35,35 @@ def create_metric_card(title, value, delta=None, delta_color="normal"):
     with st.container(border=True):
         st.metric(title, value, delta, delta_color=delta_color)
 
-def create_activity_chart():
-    """Create an activity chart showing trends"""
-    st.markdown("### Activity Trend")
-    
-    # Generate mock data
+@st.cache_data(show_spinner=False)
+def _activity_chart_data(seed=0):
+    """Mock activity trend, built once per seed"""
     dates = pd.date_range(start='2024-01-01', periods=30, freq='D')
-    values = [random.randint(50, 200) for _ in range(30)]
+    values = np.random.default_rng(seed).integers(50, 201, 30)
     
-    # Create a simple line chart using native Streamlit
-    chart_data = pd.DataFrame({
+    return pd.DataFrame({
         'Date': dates,
         'Certificates': values
-    })
+    }).set_index('Date')
+
+@st.cache_data(show_spinner=False)
+def _distribution_chart_data(items):
+    """Category/count frame keyed by the (category, count) pairs"""
+    return pd.DataFrame(list(items), columns=['Category', 'Count']).set_index('Category')
+
+def create_activity_chart():
+    """Create an activity chart showing trends"""
+    st.markdown("### Activity Trend")
     
-    st.line_chart(chart_data.set_index('Date'))
+    # Create a simple line chart using native Streamlit
+    st.line_chart(_activity_chart_data())
 
 def create_distribution_chart(data_dict):
     """Create a distribution chart"""
     st.markdown("### Distribution")
     
-    # Convert dict to dataframe
-    df = pd.DataFrame(list(data_dict.items()), columns=['Category', 'Count'])
-    
     # Create a bar chart
-    st.bar_chart(df.set_index('Category'))
+    st.bar_chart(_distribution_chart_data(tuple(data_dict.items())))
 
 def create_sparkline(data, height=50):
     """Create a small sparkline chart"""
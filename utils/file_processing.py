@@ -75,23 +75,20 @@ class SpreadsheetValidator:
         """Validate data quality and return list of issues"""
         issues = []
         
-        # Check for empty names
-        name_col = self._find_column(df, 'name')
-        if name_col and df[name_col].isna().sum() > 0:
-            issues.append(f"{df[name_col].isna().sum()} records have missing names")
-        
-        # Check for empty courses
-        course_col = self._find_column(df, 'course')
-        if course_col and df[course_col].isna().sum() > 0:
-            issues.append(f"{df[course_col].isna().sum()} records have missing courses")
+        # Check for empty names and courses (one column-wide count each)
+        for target_col, label in (('name', 'names'), ('course', 'courses')):
+            col = self._find_column(df, target_col)
+            missing = int(df[col].isna().sum()) if col else 0
+            if missing:
+                issues.append(f"{missing} records have missing {label}")
         
         # Check for invalid email formats (if email column exists)
         email_col = self._find_column(df, 'email')
         if email_col:
             email_pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-            invalid_emails = df[email_col].notna() & ~df[email_col].str.match(email_pattern, na=False)
-            if invalid_emails.sum() > 0:
-                issues.append(f"{invalid_emails.sum()} records have invalid email formats")
+            invalid_emails = int((df[email_col].notna() & ~df[email_col].str.match(email_pattern, na=False)).sum())
+            if invalid_emails:
+                issues.append(f"{invalid_emails} records have invalid email formats")
         
         return issues
     
@@ -3,8 +3,9 @@ Mobile Optimization System for SafeSteps
 Comprehensive mobile-first design with responsive layouts and touch-friendly interactions
 """
 import streamlit as st
+import functools
 import json
-from typing import Dict, List, Optional, Tuple, Any
+from typing import Dict, List, Mapping, Optional, Sequence, Tuple, Any
 from datetime import datetime
 from utils.ui_components import COLORS, TYPOGRAPHY, SPACING, BREAKPOINTS
 
@@ -30,10 +31,10 @@ class MobileDetector:
             return True
     
     @staticmethod
-    def get_device_info() -> Dict[str, Any]:
-        """Get comprehensive device information using simple parsing"""
+    @st.cache_data(max_entries=1024, show_spinner=False)
+    def parse_user_agent(user_agent_string: str) -> Dict[str, Any]:
+        """Parse a user agent string into device information (cached per string)"""
         try:
-            user_agent_string = st.session_state.get('user_agent', '')
             if user_agent_string:
                 user_agent_lower = user_agent_string.lower()
                 
@@ -86,6 +87,11 @@ class MobileDetector:
             'os': 'Unknown',
             'device': 'Unknown'
         }
+    
+    @staticmethod
+    def get_device_info() -> Dict[str, Any]:
+        """Get comprehensive device information using simple parsing"""
+        return MobileDetector.parse_user_agent(st.session_state.get('user_agent', ''))
 
     @staticmethod
     def inject_device_detection():
@@ -809,12 +815,16 @@ class MobileOptimizer:
         else:
             return layout_config["desktop"]
     
-    def create_mobile_optimized_form(self, form_fields: List[Dict[str, Any]]) -> Dict[str, Any]:
-        """Create mobile-optimized form with proper touch targets"""
+    def create_mobile_optimized_form(self, form_fields: Sequence[Mapping[str, Any]]) -> Dict[str, Any]:
+        """Create mobile-optimized form with proper touch targets
+        
+        Field definitions are only read, so callers may pass shared read-only mappings.
+        """
         device_info = self.detector.get_device_info()
         form_values = {}
         
-        with st.form("mobile_optimized_form"):
+        # Inputs only reach the server when the form is submitted, not on every edit
+        with st.form("mobile_optimized_form", clear_on_submit=False):
             for field in form_fields:
                 field_type = field.get('type', 'text')
                 field_key = field['key']
@@ -890,22 +900,34 @@ class MobileOptimizer:
                         help=field.get('help', None)
                     )
             
-            # Mobile-optimized submit button
-            submitted = self.touch_optimizer.create_touch_button(
-                text="Submit",
-                key="submit_form",
-                button_type="primary",
-                size="large" if device_info['is_mobile'] else "medium"
+            # Mobile-optimized submit button (st.button is not allowed inside a form)
+            size_class = "touch-large" if device_info['is_mobile'] else ""
+            st.markdown(f'<div class="touch-button touch-primary {size_class}">', unsafe_allow_html=True)
+            submitted = st.form_submit_button(
+                "Submit",
+                type="primary",
+                use_container_width=True
             )
+            st.markdown('</div>', unsafe_allow_html=True)
             
             if submitted:
                 return form_values
         
         return {}
 
+@st.cache_resource
+def get_mobile_optimizer() -> MobileOptimizer:
+    """Shared MobileOptimizer; it holds no per-session state"""
+    return MobileOptimizer()
+
+@st.cache_resource
+def get_mobile_nav() -> MobileNavigation:
+    """Shared MobileNavigation helper"""
+    return MobileNavigation()
+
 def apply_global_mobile_optimizations():
     """Apply mobile optimizations globally to the Streamlit app"""
-    optimizer = MobileOptimizer()
+    optimizer = get_mobile_optimizer()
     optimizer.apply_mobile_optimizations()
     
     # Set up session state for mobile preferences
@@ -935,11 +957,23 @@ def is_mobile() -> bool:
     detector = MobileDetector()
     return detector.get_device_info()['is_mobile']
 
+@functools.lru_cache(maxsize=64)
+def _select_responsive_columns(device_key: str, mobile_cols: Tuple[int, ...],
+                               tablet_cols: Tuple[int, ...], desktop_cols: Tuple[int, ...]) -> Tuple[int, ...]:
+    """Column spec for a device class, memoized per device and spec tuple"""
+    if device_key == 'mobile':
+        return mobile_cols
+    elif device_key == 'tablet':
+        return tablet_cols
+    else:
+        return desktop_cols
+
 def create_responsive_columns(*args) -> List[int]:
     """Convenience function to create responsive columns"""
-    layout = ResponsiveLayout()
-    if len(args) == 3:
-        return layout.get_responsive_columns(args[0], args[1], args[2])
-    else:
+    if len(args) != 3:
         # Default responsive pattern
-        return layout.get_responsive_columns([1], [1, 1], [1, 1, 1])
\ No newline at end of file
+        args = ([1], [1, 1], [1, 1, 1])
+    
+    device_info = MobileDetector.get_device_info()
+    device_key = 'mobile' if device_info['is_mobile'] else 'tablet' if device_info['is_tablet'] else 'desktop'
+    return list(_select_responsive_columns(device_key, *(tuple(cols) for cols in args)))
\ No newline at end of file
@@ -955,12 +955,20 @@ def create_real_time_metric(label: str, value: any, trend: str = None, icon: str
 
 # Enhanced Components for V2 - User-Friendly Guidance
 
-def create_tutorial_overlay(step_title: str, step_content: str, step_number: int, total_steps: int):
-    """Create a tutorial overlay using native modal dialog"""
+def create_tutorial_overlay(step_title: str, step_content: str, step_number: int, total_steps: int,
+                            content_html: Optional[str] = None):
+    """Create a tutorial overlay using native modal dialog
+    
+    If content_html is given (step_content already rendered to HTML), it is
+    emitted as-is instead of sending step_content through markdown parsing.
+    """
     with st.container(border=True):
         st.info(f"📚 Tutorial - Step {step_number} of {total_steps}")
         st.subheader(step_title)
-        st.markdown(step_content)
+        if content_html is not None:
+            st.html(content_html)
+        else:
+            st.markdown(step_content)
         
         col1, col2, col3 = st.columns([1, 1, 1])
         with col1:
@@ -183,21 +183,29 @@ def create_responsive_layout(mobile_breakpoint: int = 768):
     
     return layout
 
+def _new_tutorial_state() -> Dict[str, Any]:
+    """Fresh tutorial progression state"""
+    return {
+        'current_step': 1,
+        'completed_steps': [],
+        'skipped': False,
+        'started_at': datetime.now().isoformat(),
+        'completed_at': None
+    }
+
 def manage_tutorial_state(tutorial_id: str):
     """Manage tutorial progression state"""
     tutorial_key = f"tutorial_{tutorial_id}"
     
     if tutorial_key not in st.session_state:
-        st.session_state[tutorial_key] = {
-            'current_step': 1,
-            'completed_steps': [],
-            'skipped': False,
-            'started_at': datetime.now().isoformat(),
-            'completed_at': None
-        }
+        st.session_state[tutorial_key] = _new_tutorial_state()
     
     return st.session_state[tutorial_key]
 
+def reset_tutorial(tutorial_id: str):
+    """Restart tutorial from the first step"""
+    st.session_state[f"tutorial_{tutorial_id}"] = _new_tutorial_state()
+
 def advance_tutorial_step(tutorial_id: str):
     """Advance tutorial to next step"""
     tutorial_state = manage_tutorial_state(tutorial_id)
@@ -14,6 +14,9 @@ from enum import Enum
 import uuid
 import threading
 from collections import defaultdict
+import structlog
+
+logger = structlog.get_logger()
 
 class WorkflowMode(Enum):
     """Supported workflow modes"""
@@ -267,6 +270,9 @@ class FlexibleWorkflowEngine:
             with open(latest_path, 'w') as f:
                 json.dump(workflow.to_dict(), f, indent=2)
             
+            # The snapshot now includes every logged step
+            self._delta_path(workflow_id).unlink(missing_ok=True)
+            
             return True
             
         except Exception as e:
@@ -284,6 +290,7 @@ class FlexibleWorkflowEngine:
                 data = json.load(f)
             
             workflow = WorkflowState.from_dict(data)
+            self._replay_step_deltas(workflow)
             self.workflows[workflow_id] = workflow
             return workflow
             
@@ -302,6 +309,7 @@ class FlexibleWorkflowEngine:
                 data = json.load(f)
             
             workflow = WorkflowState.from_dict(data)
+            self._replay_step_deltas(workflow)
             self.workflows[workflow.workflow_id] = workflow
             return workflow.workflow_id
             
@@ -356,6 +364,7 @@ class FlexibleWorkflowEngine:
             filepath = self.storage_dir / f"workflow_{workflow_id}.json"
             if filepath.exists():
                 filepath.unlink()
+            self._delta_path(workflow_id).unlink(missing_ok=True)
             
             return True
             
@@ -369,6 +378,27 @@ class FlexibleWorkflowEngine:
         if not workflow:
             return False
         
+        # Track step completion time for behavior analysis
+        if step_id in self.step_start_times:
+            completion_time = time.time() - self.step_start_times[step_id]
+            self._update_user_behavior(workflow.user_id, step_id, completion_time)
+        
+        now = datetime.now()
+        next_step = self._apply_step_completion(workflow, step_id, step_data, now)
+        if next_step:
+            self.step_start_times[next_step] = time.time()
+        else:
+            # Workflow completed
+            self._update_user_behavior(workflow.user_id, "workflow_completed")
+        
+        # Record just this step; the full snapshot is left to auto-save
+        self._append_step_delta(workflow_id, step_id, step_data, now)
+        self._auto_save_workflow(workflow_id)
+        return True
+    
+    def _apply_step_completion(self, workflow: WorkflowState, step_id: str, 
+                               step_data: Optional[Dict], timestamp: datetime) -> Optional[str]:
+        """Mark a step completed and move to the next one, returning its id (None when finished)"""
         # Update step data
         if step_data:
             workflow.step_data[step_id] = step_data
@@ -377,26 +407,58 @@ class FlexibleWorkflowEngine:
         # Mark current step as completed
         workflow.step_statuses[step_id] = StepStatus.COMPLETED
         
-        # Track step completion time for behavior analysis
-        if step_id in self.step_start_times:
-            completion_time = time.time() - self.step_start_times[step_id]
-            self._update_user_behavior(workflow.user_id, step_id, completion_time)
-        
         # Find next available step
+        next_step = None
         next_steps = self._get_available_steps(workflow)
         if next_steps:
-            workflow.current_step = next_steps[0]
-            workflow.step_statuses[next_steps[0]] = StepStatus.ACTIVE
-            self.step_start_times[next_steps[0]] = time.time()
+            next_step = next_steps[0]
+            workflow.current_step = next_step
+            workflow.step_statuses[next_step] = StepStatus.ACTIVE
         else:
-            # Workflow completed
             workflow.current_step = None
-            workflow.completed_at = datetime.now()
-            self._update_user_behavior(workflow.user_id, "workflow_completed")
+            workflow.completed_at = timestamp
         
-        workflow.updated_at = datetime.now()
-        self._auto_save_workflow(workflow_id)
-        return True
+        workflow.updated_at = timestamp
+        return next_step
+    
+    def _delta_path(self, workflow_id: str) -> Path:
+        """Append-only log of step completions since the last full snapshot"""
+        return self.storage_dir / f"deltas_{workflow_id}.jsonl"
+    
+    def _append_step_delta(self, workflow_id: str, step_id: str, 
+                           step_data: Optional[Dict], timestamp: datetime) -> bool:
+        """Append one completed step to the workflow's delta log"""
+        try:
+            record = {'step': step_id, 'data': step_data, 'ts': timestamp.isoformat()}
+            with open(self._delta_path(workflow_id), 'a') as f:
+                f.write(json.dumps(record) + '\n')
+            return True
+        except Exception as e:
+            # The step is still applied in memory and reaches disk with the
+            # next snapshot, so this is not surfaced to the user
+            logger.error(f"Failed to record workflow step: {e}")
+            return False
+    
+    def _replay_step_deltas(self, workflow: WorkflowState):
+        """Apply step completions logged after the workflow's last snapshot"""
+        delta_path = self._delta_path(workflow.workflow_id)
+        if not delta_path.exists():
+            return
+        
+        with open(delta_path, 'r') as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                try:
+                    record = json.loads(line)
+                    step_id = record['step']
+                    timestamp = datetime.fromisoformat(record['ts'])
+                except (json.JSONDecodeError, KeyError, TypeError, ValueError) as e:
+                    # Skip a partially written or corrupt record rather than
+                    # failing the whole load
+                    logger.warning(f"Skipping unreadable workflow step record: {e}")
+                    continue
+                self._apply_step_completion(workflow, step_id, record.get('data'), timestamp)
     
     def jump_to_step(self, workflow_id: str, step_id: str) -> bool:
         """Jump directly to a specific step (if dependencies are met)"""